@@ -2,23 +2,86 @@ import os
 import threading
 import time
 import json
+import unicodedata
+import uuid
 from pathlib import Path
+from urllib.parse import quote
 from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_file, session
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, jsonify, send_file, session, stream_with_context
 import logging
 
 # Import the scraper functionality
-from scraper_module import ScraperInterface
+from scraper_module import ScraperInterface, ScrapeCancelled
+from legistar_bodies import load_body_registry, DEFAULT_BODY
+from task_queue import TaskQueue, QueueFull
+from task_store import TaskStore, ProgressRegistry, StoreCancelEvent, DEFAULT_TASK_TTL, HEARTBEAT_INTERVAL, TASK_LOST_AFTER
+from zip_stream import iter_zip
+from dir_listing import LISTING_CACHE, SORT_KEYS
+from search_index import SearchIndex, MARK_START, MARK_END
+from pdf_text_cache import PdfTextCache
+from scrape_metrics import METRICS
+from log_setup import configure_logging
+from markupsafe import escape, Markup
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Level and handlers from SCRAPER_LOG_LEVEL / SCRAPER_LOG_QUEUE / SCRAPER_LOG_FILE (default INFO)
+configure_logging()
+
+# Bodies offered in the UI; LEGISTAR_BODIES_FILE may add more (JSON of {slug: {name, url}})
+BODIES = load_body_registry(os.environ.get("LEGISTAR_BODIES_FILE"))
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key-change-in-production")
 
-# Global variables for tracking scraping progress
-scraping_progress = {}
-scraping_results = {}
+# Progress and results of scraping tasks, shared by every worker process through SQLite
+TASK_STORE = TaskStore(
+    os.environ.get("SCRAPER_TASK_DB", "scraper_tasks.sqlite3"),
+    ttl=int(os.environ.get("SCRAPER_TASK_TTL", DEFAULT_TASK_TTL)),
+)
+# Running tasks' snapshots in memory; the progress endpoints read them without locking
+PROGRESS = ProgressRegistry(TASK_STORE)
+
+# Per-page PDF text shared by the supplemental splitter and the search index
+# (set SCRAPER_TEXT_CACHE_DIR to an empty string to disable it)
+TEXT_CACHE_DIR = os.environ.get("SCRAPER_TEXT_CACHE_DIR", ".pdf_text_cache")
+TEXT_CACHE = PdfTextCache(TEXT_CACHE_DIR) if TEXT_CACHE_DIR else None
+
+# Full-text index of scraped meetings, updated as each meeting finishes
+# (set SCRAPER_SEARCH_DB to an empty string to disable it)
+SEARCH_DB = os.environ.get("SCRAPER_SEARCH_DB", "search_index.sqlite3")
+SEARCH_INDEX = SearchIndex(SEARCH_DB, text_cache=TEXT_CACHE) if SEARCH_DB else None
+# Notified on every progress publish; the SSE stream waits on it instead of polling
+progress_changed = threading.Condition()
+
+# Scrapes run on a bounded worker pool; extra submissions wait in a priority/FIFO queue
+TASK_QUEUE = TaskQueue(
+    workers=int(os.environ.get("SCRAPER_MAX_CONCURRENT_TASKS", 2)),
+    max_queued=int(os.environ.get("SCRAPER_MAX_QUEUED_TASKS", 50)),
+)
+METRICS.describe('scraper_tasks_total', 'counter', "Scraping tasks finished, by outcome")
+
+# A progress stream is closed after this many seconds and reopened by the browser
+SSE_STREAM_SECONDS = int(os.environ.get("SCRAPER_SSE_STREAM_SECONDS", 25))
+SSE_RETRY_MS = 1000
+
+_heartbeat_lock = threading.Lock()
+_heartbeat_thread = None
+
+def heartbeat():
+    """Touch this process's waiting and running tasks, so any worker can tell them from lost ones"""
+    while True:
+        time.sleep(HEARTBEAT_INTERVAL)
+        try:
+            TASK_STORE.touch(TASK_QUEUE.task_ids())
+        except Exception:
+            logging.exception("Task heartbeat failed")
+
+def start_heartbeat():
+    # Started with the first task, like TASK_QUEUE's workers
+    global _heartbeat_thread
+    with _heartbeat_lock:
+        if _heartbeat_thread is None:
+            _heartbeat_thread = threading.Thread(target=heartbeat, name="task-heartbeat", daemon=True)
+            _heartbeat_thread.start()
 
 class ProgressTracker:
     def __init__(self, task_id):
@@ -27,55 +90,166 @@ class ProgressTracker:
         self.status = "Starting..."
         self.error = None
         self.completed = False
+        self.queued = False
+        self.cancelled = False
+        # Fine-grained counters fed by ScraperInterface progress events
+        self.items_done = 0
+        self.items_total = 0
+        self.files_done = 0
+        self.bytes_downloaded = 0
+        self.current = None
+        self.item_span = None
+        # Serializes updates from the task thread and the scraper's worker threads,
+        # so snapshots are published in the order they were made
+        self.lock = threading.Lock()
+        self.last_bytes_publish = 0.0
         
-    def update(self, progress, status):
-        self.progress = progress
-        self.status = status
-        scraping_progress[self.task_id] = {
+    def publish(self, result=None):
+        """Publish the current state; callers hold self.lock"""
+        snapshot = {
             'progress': self.progress,
             'status': self.status,
             'error': self.error,
-            'completed': self.completed
+            'completed': self.completed,
+            'queued': self.queued,
+            'cancelled': self.cancelled,
+            'items_done': self.items_done,
+            'items_total': self.items_total,
+            'files_done': self.files_done,
+            'bytes_downloaded': self.bytes_downloaded,
+            'current': self.current,
         }
+        PROGRESS.publish(self.task_id, snapshot, result)
+        with progress_changed:
+            progress_changed.notify_all()
+        
+    def update(self, progress, status):
+        with self.lock:
+            self.queued = False
+            self.progress = progress
+            self.status = status
+            self.publish()
+        
+    def follow_items(self, start, end):
+        """Move the progress bar from start to end as agenda items finish"""
+        with self.lock:
+            self.item_span = (start, end)
+        
+    def on_event(self, event, data):
+        """ScraperInterface progress_callback: per-item and per-file progress"""
+        with self.lock:
+            if event == 'bytes':
+                self.bytes_downloaded += data['count']
+                # Chunks arrive many times a second; publish at most 4 times a second
+                now = time.monotonic()
+                if now - self.last_bytes_publish < 0.25:
+                    return
+                self.last_bytes_publish = now
+            elif event == 'meeting_started':
+                self.items_total += data['items_total']
+                self.current = data.get('title')
+            elif event == 'item_done':
+                self.items_done += 1
+                self.current = f"Item {data['index']}: {data['subject']}"
+            elif event == 'file_done':
+                self.files_done += 1
+            if self.item_span and self.items_total:
+                start, end = self.item_span
+                self.progress = start + int((end - start) * self.items_done / self.items_total)
+            self.publish()
+        
+    def waiting(self, position):
+        with self.lock:
+            self.queued = True
+            self.status = f"Queued (position {position})"
+            self.publish()
         
     def complete(self, result=None):
-        self.completed = True
-        self.progress = 100
-        self.status = "Completed successfully"
-        scraping_progress[self.task_id] = {
-            'progress': self.progress,
-            'status': self.status,
-            'error': self.error,
-            'completed': self.completed
-        }
-        if result:
-            scraping_results[self.task_id] = result
+        with self.lock:
+            self.queued = False
+            self.completed = True
+            self.progress = 100
+            self.status = "Completed successfully"
+            METRICS.inc('scraper_tasks_total', status='completed')
+            # Result and completed flag are written together, so whoever sees completed=True can read it
+            self.publish(result or None)
             
     def error_occurred(self, error_msg):
-        self.error = error_msg
-        self.status = f"Error: {error_msg}"
-        self.completed = True
-        scraping_progress[self.task_id] = {
-            'progress': self.progress,
-            'status': self.status,
-            'error': self.error,
-            'completed': self.completed
-        }
+        with self.lock:
+            self.queued = False
+            self.error = error_msg
+            self.status = f"Error: {error_msg}"
+            self.completed = True
+            METRICS.inc('scraper_tasks_total', status='failed')
+            self.publish()
+        
+    def cancel(self):
+        with self.lock:
+            self.queued = False
+            self.cancelled = True
+            self.completed = True
+            self.status = "Cancelled"
+            METRICS.inc('scraper_tasks_total', status='cancelled')
+            self.publish()
+
+def discover_all_bodies(scraper, start_date, end_date):
+    """Meetings across every registered body as (date, time, url) tuples, shared meetings once"""
+    meetings, stats = scraper.discover_meetings(start_date, end_date)
+    for slug, body_stats in stats.items():
+        logging.debug("Calendar %s: %s", slug, body_stats)
+    return [(m['date'], m['time'], m['url']) for m in meetings]
 
-def background_scraper_task(task_id, scraper_params):
-    """Background task to run the scraper"""
+def background_scraper_task(task_id, scraper_params, cancel_event=None):
+    """Background task to run the scraper (run by TASK_QUEUE, which supplies cancel_event)"""
     tracker = ProgressTracker(task_id)
+    scraper = None
+    # The scraper checks params['cancel_event'] between meetings and agenda items;
+    # it also fires for cancel requests sent to other worker processes
+    cancel_event = StoreCancelEvent(TASK_STORE, task_id, cancel_event)
+    scraper_params = dict(scraper_params, cancel_event=cancel_event)
+    if cancel_event.is_set():
+        # Cancelled through another process while it waited in this one's queue;
+        # that process has usually published the cancellation already
+        if not (PROGRESS.get(task_id) or {}).get('cancelled'):
+            tracker.cancel()
+        return
     
     try:
         tracker.update(10, "Initializing scraper...")
-        scraper = ScraperInterface()
+        # Keep enough pooled connections for the item and download pools of every meeting in flight
+        max_workers = scraper_params.get('max_workers', 1)
+        meeting_workers = scraper_params.get('meeting_workers', 1) if scraper_params.get('process_all') else 1
+        body = scraper_params.get('body', DEFAULT_BODY)
+        scraper = ScraperInterface(
+            pool_maxsize=max(10, 2 * max_workers * meeting_workers),
+            # Throttling is opt-in: SCRAPER_RATE_LIMIT=4 caps this task at 4 requests/s per host
+            # whatever max_workers is; the burst defaults to one request per pooled connection
+            rate=float(os.environ.get("SCRAPER_RATE_LIMIT") or 0),
+            burst=int(os.environ.get("SCRAPER_RATE_BURST") or max(8, 2 * max_workers * meeting_workers)),
+            # Set SCRAPER_CACHE_DIR to an empty string to disable the HTTP cache
+            cache_dir=os.environ.get("SCRAPER_CACHE_DIR", ".http_cache") or None,
+            body=DEFAULT_BODY if body == 'all' else body,
+            # SCRAPER_PARSER=soup falls back to full BeautifulSoup parsing
+            parser=os.environ.get("SCRAPER_PARSER", "lxml"),
+            bodies=BODIES,
+            # e.g. SCRAPER_SPLIT_HEADER_CLIP=0.25 finds report boundaries from the top quarter of each page
+            # (~1.2x faster); SCRAPER_SPLIT_HEADER_BLOCKS alone is slower than reading full pages
+            split_header_clip=float(os.environ["SCRAPER_SPLIT_HEADER_CLIP"]) if os.environ.get("SCRAPER_SPLIT_HEADER_CLIP") else None,
+            split_header_blocks=int(os.environ["SCRAPER_SPLIT_HEADER_BLOCKS"]) if os.environ.get("SCRAPER_SPLIT_HEADER_BLOCKS") else None,
+            progress_callback=tracker.on_event,
+            search_index=SEARCH_INDEX,
+            text_cache=TEXT_CACHE,
+        )
         
         if scraper_params['mode'] == 'date':
             date_mode = scraper_params.get('date_mode', 'single')
             
             if date_mode == 'single':
                 tracker.update(20, f"Fetching meetings for date {scraper_params['date']}...")
-                meetings = scraper.fetch_meetings_for_date(scraper_params['date'])
+                if body == 'all':
+                    meetings = discover_all_bodies(scraper, scraper_params['date'], scraper_params['date'])
+                else:
+                    meetings = scraper.fetch_meetings_for_date(scraper_params['date'])
                 
                 if not meetings:
                     tracker.error_occurred(f"No meetings found for {scraper_params['date']}")
@@ -89,6 +263,7 @@ def background_scraper_task(task_id, scraper_params):
                         
                     date, time_text, url = meetings[meeting_idx]
                     tracker.update(40, f"Processing meeting on {date} at {time_text}...")
+                    tracker.follow_items(40, 99)
                     result = scraper.process_meeting(url, scraper_params['output_folder'], scraper_params)
                     tracker.complete(result)
                 else:
@@ -98,26 +273,76 @@ def background_scraper_task(task_id, scraper_params):
             elif date_mode == 'range':
                 tracker.update(20, f"Fetching meetings from {scraper_params['start_date']} to {scraper_params['end_date']}...")
                 try:
-                    meetings = scraper.fetch_meetings_for_date_range(scraper_params['start_date'], scraper_params['end_date'])
+                    if body == 'all':
+                        meetings = discover_all_bodies(scraper, scraper_params['start_date'], scraper_params['end_date'])
+                    else:
+                        meetings = scraper.fetch_meetings_for_date_range(scraper_params['start_date'], scraper_params['end_date'])
                     
                     if not meetings:
                         tracker.error_occurred(f"No meetings found between {scraper_params['start_date']} and {scraper_params['end_date']}")
                         return
                     
-                    # Return list of meetings for selection
-                    tracker.complete({'meetings': meetings, 'mode': 'select_meeting', 'date_range': True})
+                    if not scraper_params.get('process_all'):
+                        # Return list of meetings for selection
+                        tracker.complete({'meetings': meetings, 'mode': 'select_meeting', 'date_range': True})
+                        return
+                    
+                    total = len(meetings)
+                    tracker.update(25, f"Processing {total} meetings...")
+                    
+                    def meeting_done(done, total, meeting_result):
+                        state = "failed" if meeting_result.get('error') else "done"
+                        tracker.update(
+                            25 + int(74 * done / total),
+                            f"Processed {done}/{total} meetings ({meeting_result['date']} {state})"
+                        )
+                    
+                    results = scraper.process_meetings(
+                        meetings,
+                        scraper_params['output_folder'],
+                        scraper_params,
+                        meeting_workers=meeting_workers,
+                        progress_callback=meeting_done,
+                    )
+                    tracker.complete({
+                        'mode': 'range_job',
+                        'output_folder': scraper_params['output_folder'],
+                        'meetings_count': total,
+                        'failed_count': sum(1 for r in results if r.get('error')),
+                        # Phase times, bytes and HTTP counters across the whole job
+                        'timings': scraper.metrics_summary(),
+                        'meetings': [
+                            {
+                                'date': r['date'],
+                                'time': r['time'],
+                                'url': r['url'],
+                                'title': r.get('title'),
+                                'output_folder': r['output_folder'],
+                                'items_count': len(r.get('processed_items', [])),
+                                'error': r.get('error'),
+                            }
+                            for r in results
+                        ],
+                    })
                 except ValueError as e:
                     tracker.error_occurred(str(e))
                     return
                 
         elif scraper_params['mode'] == 'url':
             tracker.update(30, "Processing meeting from URL...")
+            tracker.follow_items(30, 99)
             result = scraper.process_meeting(scraper_params['url'], scraper_params['output_folder'], scraper_params)
             tracker.complete(result)
             
+    except ScrapeCancelled:
+        logging.info("Scraper task %s cancelled", task_id)
+        tracker.cancel()
     except Exception as e:
-        logging.error(f"Scraper task error: {str(e)}")
+        logging.error("Scraper task error: %s", str(e))
         tracker.error_occurred(str(e))
+    finally:
+        if scraper is not None:
+            scraper.close()
 
 @app.route('/')
 def index():
@@ -128,8 +353,8 @@ def index():
 def scrape():
     """Scraping configuration and execution"""
     if request.method == 'POST':
-        # Generate unique task ID
-        task_id = f"task_{int(time.time())}"
+        # Generate unique task ID (random, so tasks started in the same second never collide)
+        task_id = f"task_{uuid.uuid4().hex}"
         
         # Get form data
         mode = request.form.get('mode')
@@ -137,13 +362,26 @@ def scrape():
         selection = request.form.get('selection', '').split() if request.form.get('selection') else None
         remove_output = 'remove_output' in request.form
         split_supplemental = 'split_supplemental' in request.form
+        resync = 'resync' in request.form
+        try:
+            max_workers = max(1, min(16, int(request.form.get('max_workers', 1))))
+        except ValueError:
+            max_workers = 1
+        
+        body = request.form.get('body', DEFAULT_BODY)
+        if body != 'all' and body not in BODIES:
+            flash('Unknown legislative body', 'error')
+            return redirect(url_for('scrape'))
         
         scraper_params = {
             'mode': mode,
+            'body': body,
             'output_folder': output_folder,
             'selection': selection,
             'remove_output': remove_output,
             'split_supplemental': split_supplemental,
+            'resync': resync,
+            'max_workers': max_workers,
             'verbose': True
         }
         
@@ -175,6 +413,11 @@ def scrape():
                     return redirect(url_for('scrape'))
                 scraper_params['start_date'] = start_date
                 scraper_params['end_date'] = end_date
+                scraper_params['process_all'] = 'process_all' in request.form
+                try:
+                    scraper_params['meeting_workers'] = max(1, min(8, int(request.form.get('meeting_workers', 2))))
+                except ValueError:
+                    scraper_params['meeting_workers'] = 2
                     
         elif mode == 'url':
             url = request.form.get('url')
@@ -186,17 +429,24 @@ def scrape():
             flash('Invalid scraping mode', 'error')
             return redirect(url_for('scrape'))
         
-        # Start background task
-        thread = threading.Thread(target=background_scraper_task, args=(task_id, scraper_params))
-        thread.daemon = True
-        thread.start()
+        # Queue the background task; "high" priority jumps ahead of normal submissions
+        priority = 0 if request.form.get('priority') == 'high' else 1
+        # Marked queued before submitting, so a worker that starts it at once isn't overwritten
+        ProgressTracker(task_id).waiting(TASK_QUEUE.stats()['queued'] + 1)
+        try:
+            TASK_QUEUE.submit(task_id, background_scraper_task, task_id, scraper_params, priority=priority)
+            start_heartbeat()
+        except QueueFull:
+            PROGRESS.discard(task_id)
+            flash('The scraper is busy; too many tasks are waiting. Please try again later.', 'error')
+            return redirect(url_for('scrape'))
         
         # Store task ID in session
         session['current_task_id'] = task_id
         
         return redirect(url_for('progress'))
     
-    return render_template('scrape.html')
+    return render_template('scrape.html', bodies=BODIES, default_body=DEFAULT_BODY)
 
 @app.route('/progress')
 def progress():
@@ -208,45 +458,113 @@ def progress():
     
     return render_template('progress.html', task_id=task_id)
 
-@app.route('/api/progress/<task_id>')
-def api_progress(task_id):
-    """API endpoint for progress updates"""
-    progress_data = scraping_progress.get(task_id, {
+def progress_payload(task_id):
+    """Progress snapshot for a task, with queue position and result where they apply"""
+    progress_data = PROGRESS.get(task_id) or {
         'progress': 0,
         'status': 'Task not found',
         'error': 'Task ID not found',
         'completed': True
-    })
+    }
+    
+    # Waiting tasks report their live place in the queue
+    if progress_data.get('queued'):
+        position = TASK_QUEUE.position(task_id)
+        if position is not None:
+            progress_data = dict(progress_data, queue_position=position, status=f"Queued (position {position})")
+    
+    # An unfinished task that no process has touched lately lost its worker (restart, crash)
+    if not progress_data.get('completed') and not TASK_QUEUE.active(task_id):
+        updated_at = TASK_STORE.updated_at(task_id)
+        if updated_at is None or time.time() - updated_at > TASK_LOST_AFTER:
+            progress_data = dict(progress_data, completed=True, status='Task stopped',
+                                 error='The task is no longer running (the server may have restarted)')
     
     # Include results if completed and available
-    if progress_data.get('completed') and task_id in scraping_results:
-        progress_data['result'] = scraping_results[task_id]
+    if progress_data.get('completed'):
+        result = TASK_STORE.get_result(task_id)
+        if result is not None:
+            progress_data = dict(progress_data, result=result)
     
-    return jsonify(progress_data)
+    return progress_data
+
+@app.route('/api/progress/<task_id>')
+def api_progress(task_id):
+    """API endpoint for progress updates"""
+    return jsonify(progress_payload(task_id))
+
+@app.route('/api/progress/<task_id>/stream')
+def api_progress_stream(task_id):
+    """Server-Sent Events stream of progress snapshots, pushed as they change.
+
+    Each stream ends after SSE_STREAM_SECONDS and the browser reconnects, so an
+    open progress tab never holds a request worker for a whole task.
+    """
+    def events():
+        last_sent = None
+        last_write = started = time.monotonic()
+        # Reconnect a second after the stream ends
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        while time.monotonic() - started < SSE_STREAM_SECONDS:
+            # The first snapshot goes out at once; unknown, finished and lost tasks end the stream
+            payload = progress_payload(task_id)
+            if payload != last_sent:
+                last_sent = payload
+                last_write = time.monotonic()
+                yield f"data: {json.dumps(payload)}\n\n"
+                if payload.get('completed'):
+                    return
+            elif time.monotonic() - last_write > 15:
+                # Comment line keeps proxies from closing an idle stream
+                last_write = time.monotonic()
+                yield ": keep-alive\n\n"
+            with progress_changed:
+                # Wake at least once a second so queue positions stay current
+                progress_changed.wait(timeout=1.0)
+    
+    response = Response(stream_with_context(events()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/cancel/<task_id>', methods=['POST'])
+def api_cancel(task_id):
+    """Cancel a waiting task, or ask a running one to stop at its next agenda item"""
+    state = TASK_QUEUE.cancel(task_id)
+    if state is None and TASK_STORE.request_cancel(task_id):
+        # Waiting or running in another worker process, which polls the store for the request
+        snapshot = PROGRESS.get(task_id) or {}
+        state = 'queued' if snapshot.get('queued') else 'running'
+    if state == 'queued':
+        ProgressTracker(task_id).cancel()
+    return jsonify({'cancelled': state is not None, 'state': state})
 
 @app.route('/browse')
 def browse():
     """File browser for downloaded documents"""
     folder_path = request.args.get('path', 'OUT_MEETING_FOLDER')
     folder = Path(folder_path)
+    sort = request.args.get('sort', 'name')
+    if sort not in SORT_KEYS:
+        sort = 'name'
+    order = 'desc' if request.args.get('order') == 'desc' else 'asc'
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        per_page = max(1, min(1000, int(request.args.get('per_page', 200))))
+    except ValueError:
+        page, per_page = 1, 200
     
     items = []
+    total = 0
     error_msg = None
     
     try:
-        if folder.exists() and folder.is_dir():
-            for item in sorted(folder.iterdir()):
-                if item.name.startswith('.'):
-                    continue
-                    
-                item_info = {
-                    'name': item.name,
-                    'path': str(item),
-                    'is_dir': item.is_dir(),
-                    'size': item.stat().st_size if item.is_file() else 0,
-                    'modified': datetime.fromtimestamp(item.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                }
-                items.append(item_info)
+        if folder.is_dir():
+            entries, total = LISTING_CACHE.page(folder_path, sort, order == 'desc', page, per_page)
+            items = [
+                dict(entry, modified=datetime.fromtimestamp(entry['mtime']).strftime('%Y-%m-%d %H:%M:%S'))
+                for entry in entries
+            ]
         else:
             error_msg = f"Folder '{folder_path}' does not exist"
     except Exception as e:
@@ -259,7 +577,13 @@ def browse():
                          items=items, 
                          current_path=folder_path,
                          parent_path=parent_path,
-                         error=error_msg)
+                         error=error_msg,
+                         total=total,
+                         page=page,
+                         pages=max(1, -(-total // per_page)),
+                         per_page=per_page,
+                         sort=sort,
+                         order=order)
 
 @app.route('/download')
 def download():
@@ -290,42 +614,84 @@ def download_folder_zip():
         flash('Folder not found', 'error')
         return redirect(url_for('browse'))
     
+    # Built on the fly: the first bytes go out at once and nothing is written to disk
+    zip_filename = f"{folder.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    response = Response(stream_with_context(iter_zip(folder)), mimetype='application/zip')
+    response.headers.set('Content-Disposition', 'attachment', **download_name_options(zip_filename))
+    return response
+
+def download_name_options(filename):
+    """Content-Disposition filename parameters, as send_file builds them: an ASCII
+    fallback plus RFC 5987 filename* for names that aren't Latin-1"""
     try:
-        import zipfile
-        import tempfile
-        import os
-        from datetime import datetime
-        
-        # Create a temporary zip file
-        temp_dir = tempfile.mkdtemp()
-        zip_filename = f"{folder.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-        zip_path = Path(temp_dir) / zip_filename
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(folder):
-                for file in files:
-                    file_path = Path(root) / file
-                    # Create relative path for zip archive
-                    arcname = file_path.relative_to(folder.parent)
-                    zipf.write(file_path, arcname)
-        
-        def remove_temp_file():
-            """Clean up temporary file after download"""
-            try:
-                os.unlink(zip_path)
-                os.rmdir(temp_dir)
-            except:
-                pass
-        
-        # Schedule cleanup after response
-        import atexit
-        atexit.register(remove_temp_file)
-        
-        return send_file(zip_path, as_attachment=True, download_name=zip_filename)
-        
-    except Exception as e:
-        flash(f'Error creating zip file: {str(e)}', 'error')
-        return redirect(url_for('browse'))
+        filename.encode('latin-1')
+    except UnicodeEncodeError:
+        ascii_name = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+        return {'filename': ascii_name, 'filename*': f"UTF-8''{quote(filename, safe='!#$&+^`|')}"}
+    return {'filename': filename}
+
+def search_hits(query, page, per_page):
+    """Search hits with snippets made safe to render: text escaped, matches in <mark>"""
+    hits = SEARCH_INDEX.search(query, limit=per_page, offset=(page - 1) * per_page) if SEARCH_INDEX else []
+    for hit in hits:
+        hit['snippet_html'] = Markup(
+            str(escape(hit['snippet'])).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+        )
+    return hits
+
+@app.route('/search')
+def search():
+    """Full-text search over scraped agendas and attachments"""
+    query = request.args.get('q', '').strip()
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+    except ValueError:
+        page = 1
+    per_page = 20
+    started = time.perf_counter()
+    hits = search_hits(query, page, per_page) if query else []
+    return render_template('search.html',
+                         query=query,
+                         hits=hits,
+                         page=page,
+                         per_page=per_page,
+                         elapsed_ms=(time.perf_counter() - started) * 1000,
+                         enabled=SEARCH_INDEX is not None)
+
+@app.route('/api/search')
+def api_search():
+    """JSON search hits: ?q=...&limit=...&offset=..."""
+    if SEARCH_INDEX is None:
+        return jsonify({'error': 'Search index disabled', 'hits': []}), 503
+    try:
+        limit = max(1, min(100, int(request.args.get('limit', 20))))
+        offset = max(0, int(request.args.get('offset', 0)))
+    except ValueError:
+        limit, offset = 20, 0
+    hits = SEARCH_INDEX.search(request.args.get('q', ''), limit=limit, offset=offset)
+    for hit in hits:
+        hit['snippet'] = hit['snippet'].replace(MARK_START, "").replace(MARK_END, "")
+    return jsonify({'query': request.args.get('q', ''), 'hits': hits})
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for this worker process: scrape phases, HTTP, tasks and caches"""
+    samples = [
+        ('scraper_task_queue_tasks', 'gauge', "Tasks waiting for or holding a worker", count, {'state': state})
+        for state, count in TASK_QUEUE.stats().items() if state != 'workers'
+    ]
+    samples.append(('scraper_task_queue_workers', 'gauge', "Concurrent task limit", TASK_QUEUE.workers, {}))
+    samples.append(('scraper_tasks_in_progress', 'gauge', "Tasks with live progress in this process", len(PROGRESS), {}))
+    caches = [('listing', LISTING_CACHE)] + ([('pdf_text', TEXT_CACHE)] if TEXT_CACHE else [])
+    for name, cache in caches:
+        samples.append(('scraper_cache_lookups_total', 'counter', "Lookups in in-process caches",
+                        cache.hits, {'cache': name, 'result': 'hit'}))
+        samples.append(('scraper_cache_lookups_total', 'counter', "Lookups in in-process caches",
+                        cache.misses, {'cache': name, 'result': 'miss'}))
+    if SEARCH_INDEX is not None:
+        for kind, count in SEARCH_INDEX.stats().items():
+            samples.append(('scraper_search_index_size', 'gauge', "Indexed documents and pages", count, {'kind': kind}))
+    return Response(METRICS.render(samples), mimetype='text/plain; version=0.0.4')
 
 @app.route('/view_markdown')
 def view_markdown():
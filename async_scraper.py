@@ -0,0 +1,428 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+import scrape_metrics
+from http_cache import CachedResponse
+from http_transport import RETRY_STATUSES
+from meeting_manifest import merge_hashes, utc_now
+from scraper_module import ScraperInterface, FilenameClaims
+
+
+class AsyncFilenameClaims(FilenameClaims):
+    """FilenameClaims for downloads running as tasks on one event loop"""
+
+    def __init__(self):
+        super().__init__()
+        self._turn = asyncio.Condition()
+
+    async def claim_async(self, position, filename):
+        async with self._turn:
+            await self._turn.wait_for(lambda: self.ready(position))
+            name = self.claim(position, filename)
+            self._turn.notify_all()
+        return name
+
+    async def release_async(self, position):
+        async with self._turn:
+            self.release(position)
+            self._turn.notify_all()
+
+
+class AsyncScraperInterface(ScraperInterface):
+    """asyncio variant of the ScraperInterface pipeline for bulk backfills.
+
+    Every request, across all meetings handled by one instance, goes through a
+    single semaphore, so thousands of requests can be queued without a thread
+    per request. Parsing, folder/markdown layout, the HTTP cache and the
+    meeting manifest (re-sync) are shared with ScraperInterface, requests share
+    the sync transport's rate limiter, retry policy and metrics, and results
+    have the same shape. File system work runs in threads, off the event loop.
+
+    Usage:
+        async with AsyncScraperInterface(max_concurrency=64) as scraper:
+            results = await scraper.process_date_range_async("1/1/2024", "12/31/2024", "OUT")
+    """
+
+    def __init__(self, max_concurrency=64, limit_per_host=16, timeout=60, **kwargs):
+        super().__init__(**kwargs)
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.http = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def open(self):
+        """Create the aiohttp session and the global concurrency semaphore"""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.limit_per_host,
+        )
+        self.http = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def aclose(self):
+        """Close the aiohttp session and the inherited sync transport"""
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+        self.close()
+
+    async def _request_async(self, method, url, headers=None):
+        """Send a request through the shared rate limiter, retrying 429/5xx and connection errors"""
+        transport = self.transport
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            waited = max(transport.rate_limiter.reserve(host), 0.0)
+            if waited:
+                await asyncio.sleep(waited)
+            transport.record_request(waited)
+            try:
+                response = await self.http.request(method, url, headers=headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= transport.max_retries:
+                    raise
+                delay = transport.backoff_delay(attempt)
+                transport.record_retry(url, delay, type(e).__name__)
+            else:
+                if response.status not in RETRY_STATUSES or attempt >= transport.max_retries:
+                    return response
+                delay = transport.backoff_delay(attempt, response)
+                response.release()
+                transport.record_retry(url, delay, f"HTTP {response.status}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _get_async(self, url, headers=None):
+        """GET through the shared rate limiter, retrying 429/5xx and connection errors"""
+        return await self._request_async("GET", url, headers)
+
+    async def fetch_html_async(self, url, revalidate=False):
+        """Async counterpart of fetch_html, through the same HTTP cache as HTTPTransport.fetch"""
+        logging.debug("Fetching: %s", url)
+        cache = self.transport.cache
+        entry = None
+        if cache is not None:
+            entry, fresh = await asyncio.to_thread(cache.lookup, url)
+            if fresh and not revalidate:
+                cached = await asyncio.to_thread(cache.response_for, entry)
+                if cached is not None:
+                    scrape_metrics.count('cache_hits')
+                    return self._cached_html(cached)
+        while True:
+            async with self._semaphore:
+                async with await self._get_async(url, cache.conditional_headers(entry) if entry else None) as resp:
+                    if resp.status == 304 and entry is not None:
+                        cached = await asyncio.to_thread(cache.response_for, entry)
+                        if cached is not None:
+                            await asyncio.to_thread(cache.refresh, url, resp.headers)
+                            scrape_metrics.count('cache_revalidated')
+                            return self._cached_html(cached)
+                        # Body vanished from disk; fetch it unconditionally
+                        entry = None
+                        continue
+                    resp.raise_for_status()
+                    body = await resp.read()
+                    encoding = resp.get_encoding()
+            break
+        if cache is not None:
+            await asyncio.to_thread(cache.store, url, resp.headers, body, encoding)
+        scrape_metrics.count('bytes_html', len(body), self.timings)
+        return body.decode(encoding, errors="replace")
+
+    def _cached_html(self, cached):
+        scrape_metrics.count('bytes_html', len(cached.content), self.timings)
+        return cached.text
+
+    async def fetch_soup_async(self, url):
+        """Fetch and parse HTML from URL"""
+        return BeautifulSoup(await self.fetch_html_async(url), "lxml")
+
+    async def head_headers_async(self, href):
+        """Async counterpart of head_headers"""
+        try:
+            async with self._semaphore:
+                async with await self._request_async("HEAD", href) as response:
+                    if response.status in (405, 501) or not response.ok or 'Content-Length' not in response.headers:
+                        return None
+                    return response.headers
+        except aiohttp.ClientError as e:
+            logging.debug("HEAD failed for %s: %s", href, e)
+            return None
+
+    async def download_file_record_async(self, href, default_name, folder_path, skip_download=False,
+                                         check_existing=None, claim=None):
+        """Async counterpart of download_file_record; claim is an async filename mapper"""
+        async def resolve(headers_from):
+            filename = self.infer_filename_with_extension(href, default_name, headers_from)
+            return await claim(filename) if claim else filename
+
+        def exists(filename):
+            return (folder_path / filename).exists()
+
+        try:
+            cache = self.transport.cache
+            if cache is not None:
+                # Fresh cached headers resolve the filename with no request at all
+                entry, fresh = await asyncio.to_thread(cache.lookup, href, False)
+                if fresh:
+                    filename = await resolve(CachedResponse(href, entry['headers']))
+                    if skip_download or await asyncio.to_thread(exists, filename):
+                        logging.debug("Skipping cached file: %s", filename)
+                        scrape_metrics.count('cache_hits')
+                        return await asyncio.to_thread(self.file_record, href, folder_path, filename)
+
+            # Re-scrapes: a HEAD names the file, so one already on disk costs no body transfer
+            if check_existing is None:
+                check_existing = skip_download or await asyncio.to_thread(self.has_downloads, folder_path)
+            if check_existing:
+                headers = await self.head_headers_async(href)
+                if headers is not None:
+                    if cache is not None:
+                        await asyncio.to_thread(cache.store, href, headers)
+                    filename = await resolve(CachedResponse(href, headers))
+                    if skip_download or await asyncio.to_thread(exists, filename):
+                        logging.debug("Skipping existing file: %s", filename)
+                        return await asyncio.to_thread(self.file_record, href, folder_path, filename)
+
+            async with self._semaphore:
+                async with await self._get_async(href) as response:
+                    response.raise_for_status()
+                    if cache is not None:
+                        await asyncio.to_thread(cache.store, href, response.headers)
+                    filename = await resolve(response)
+                    full_path = folder_path / filename
+
+                    if skip_download or await asyncio.to_thread(full_path.exists):
+                        logging.debug("Not fetching %s file: %s", "disabled" if skip_download else "existing", filename)
+                        # As in release_response: a small body is read so the connection is reused
+                        length = response.headers.get('Content-Length')
+                        if length is not None and length.isdigit() and int(length) <= 64 * 1024:
+                            await response.read()
+                        return await asyncio.to_thread(self.file_record, href, folder_path, filename)
+
+                    logging.debug("Downloading file: %s", filename)
+                    size, sha256 = await self._stream_response_to_file(response, full_path)
+                    return self.file_record(href, folder_path, filename, size, sha256)
+        except Exception as e:
+            logging.error("Failed to download file from %s: %s", href, e)
+            return None
+
+    async def download_file_to_folder_async(self, href, default_name, folder_path, skip_download=False):
+        """Download file to specified folder, streaming the body in chunk_size pieces"""
+        record = await self.download_file_record_async(href, default_name, folder_path, skip_download)
+        return record['filename'] if record else None
+
+    async def _stream_response_to_file(self, response, full_path):
+        """Async counterpart of ScraperInterface.stream_response_to_file; disk writes run in a thread.
+
+        Returns (size, sha256) of the written file.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_name = await asyncio.to_thread(tempfile.mkstemp, dir=full_path.parent, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    await asyncio.to_thread(tmp.write, chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+                    self.report_progress('bytes', count=len(chunk), filename=full_path.name)
+            await asyncio.to_thread(os.chmod, tmp_name, 0o644)
+            await asyncio.to_thread(os.replace, tmp_name, full_path)
+            scrape_metrics.count('bytes_downloaded', size, self.timings)
+            return size, digest.hexdigest()
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    async def download_records_async(self, downloads, folder_path, skip_download=False):
+        """Async counterpart of download_records: concurrent, in order, failed downloads dropped"""
+        check_existing = skip_download or await asyncio.to_thread(self.has_downloads, folder_path)
+        claims = AsyncFilenameClaims()
+
+        async def fetch(position, href, default_name):
+            try:
+                with self.timed('attachment_download'):
+                    record = await self.download_file_record_async(
+                        href, default_name, folder_path, skip_download, check_existing,
+                        claim=lambda filename: claims.claim_async(position, filename),
+                    )
+            finally:
+                await claims.release_async(position)
+            self.report_progress(
+                'file_done', url=href,
+                filename=record['filename'] if record else None,
+                size=record['size'] if record else None,
+                failed=record is None,
+            )
+            return record
+
+        results = await asyncio.gather(*(
+            fetch(i, href, default_name) for i, (href, default_name) in enumerate(downloads)
+        ))
+        return [record for record in results if record]
+
+    async def download_files_async(self, downloads, folder_path, skip_download=False):
+        """Download (href, default_name) pairs concurrently, keeping their order"""
+        records = await self.download_records_async(downloads, folder_path, skip_download)
+        return [record['filename'] for record in records]
+
+    async def fetch_meetings_for_date_range_async(self, start_date, end_date):
+        """Async counterpart of fetch_meetings_for_date_range"""
+        start_dt, end_dt = self.parse_date_range(start_date, end_date)
+        html = await self.fetch_html_async(self.DEPARTMENT_PAGE)
+        return self.filter_meetings_in_range(self.parse_calendar_page(html), start_dt, end_dt)
+
+    async def process_agenda_item_entry_async(self, index, subj, url, base_folder, skip_download=False, html=None):
+        """Async counterpart of process_agenda_item_entry"""
+        if html is None:
+            with self.timed('item_fetch'):
+                html = await self.fetch_html_async(url)
+        with self.timed('parse'):
+            item_dt, desc, attachments = self.parse_agenda_item_page(html)
+        folder = await asyncio.to_thread(self.write_agenda_item, index, subj, item_dt, desc, attachments, base_folder)
+
+        records = await self.download_records_async(self.attachment_downloads(attachments), folder, skip_download)
+
+        logging.debug("Finished processing Item %s: downloaded %s attachments", index, len(records))
+        return {
+            'index': index,
+            'subject': subj,
+            'url': url,
+            'folder': folder.name,
+            'attachments': records,
+            'fetched_at': utc_now(),
+        }
+
+    async def process_agenda_item_async(self, index, subj, url, base_folder, skip_download=False):
+        """Process individual agenda item"""
+        entry = await self.process_agenda_item_entry_async(index, subj, url, base_folder, skip_download)
+        return [record['filename'] for record in entry['attachments']]
+
+    async def process_meeting_async(self, meeting_url, dest, params):
+        """Process a complete meeting; result matches ScraperInterface.process_meeting"""
+        start = time.perf_counter()
+        with scrape_metrics.collect(scrape_metrics.PhaseTimings()) as timings:
+            result = await self._process_meeting_async(meeting_url, dest, params)
+        result['timings'] = dict(timings.summary(), wall_seconds=round(time.perf_counter() - start, 3))
+        return result
+
+    async def _process_meeting_async(self, meeting_url, dest, params):
+        import shutil
+
+        self.check_cancelled(params)
+        dest = Path(dest)
+
+        if params.get('remove_output') and dest.exists():
+            logging.debug("Removing existing folder: %s", dest)
+            await asyncio.to_thread(shutil.rmtree, dest)
+
+        await asyncio.to_thread(dest.mkdir, parents=True, exist_ok=True)
+        logging.debug("Output folder: %s", dest)
+
+        # A re-sync must see the live agenda, not a cached copy
+        with self.timed('meeting_fetch'):
+            html = await self.fetch_html_async(meeting_url, revalidate=bool(params.get('resync')))
+        with self.timed('parse'):
+            title, meeting_dt, extras, items = self.parse_meeting_page(html, meeting_url)
+        await asyncio.to_thread(self.extend_past_meeting_ttl, meeting_url, meeting_dt)
+        await asyncio.to_thread(self.write_meeting_header, dest, title, meeting_dt, extras, items)
+
+        skip_download = params.get('skip_download', False)
+        plan = await asyncio.to_thread(self.resync_plan, dest, items, extras, params)
+        candidates = plan['candidates']
+        previous_items = plan['previous_items']
+
+        async def run_item(idx, subj, url):
+            """(manifest entry, True if it was fetched rather than reused), as in process_meeting"""
+            self.check_cancelled(params)
+            html = None
+            old = candidates.get(idx)
+            if old is not None:
+                with self.timed('item_fetch'):
+                    html = await self.fetch_html_async(url, revalidate=True)
+                with self.timed('parse'):
+                    attachments = self.parse_agenda_item_page(html)[2]
+                if self.attachments_unchanged(attachments, old):
+                    logging.debug("Unchanged Item %s: %s", idx, subj)
+                    self.report_progress('item_done', url=meeting_url, index=idx, subject=subj)
+                    return old, False
+            logging.debug("Processing Item%s: %s", idx, subj)
+            entry = await self.process_agenda_item_entry_async(idx, subj, url, dest, skip_download, html=html)
+            old = previous_items.get(idx)
+            merge_hashes(entry['attachments'], old['attachments'] if old else None)
+            self.report_progress('item_done', url=meeting_url, index=idx, subject=subj)
+            return entry, True
+
+        work, extra_work = plan['work'], plan['extra_work']
+        self.report_progress(
+            'meeting_started', url=meeting_url, title=title,
+            items_total=len(work), files_total=len(extra_work),
+        )
+        extra_records, *outcomes = await asyncio.gather(
+            self.download_records_async(extra_work, dest, skip_download),
+            *(run_item(idx, subj, url) for idx, subj, url in work),
+        )
+
+        result = await asyncio.to_thread(
+            self.meeting_result, meeting_url, dest, title, meeting_dt, extras, items, plan, outcomes, extra_records,
+        )
+        # PyMuPDF work is CPU bound and indexing reads files; keep both off the event loop
+        await asyncio.to_thread(
+            self.finish_meeting, dest, result, params,
+            changed=bool(result['items_fetched'] or extra_records) or not plan['resync'],
+        )
+        logging.debug("Meeting processing completed")
+        return result
+
+    async def process_date_range_async(self, start_date, end_date, output_root, params=None):
+        """Scrape every meeting in a date range into output_root/<date time ID>/ concurrently.
+
+        Results match ScraperInterface.process_meetings: one per meeting, in order,
+        with date/time/url added, or {date, time, url, output_folder, error} on failure.
+        """
+        params = params or {}
+        meetings = await self.fetch_meetings_for_date_range_async(start_date, end_date)
+        folders = self.meeting_folders(meetings, output_root)
+
+        async def run(date, time_text, url, dest):
+            try:
+                result = await self.process_meeting_async(url, dest, params)
+            except Exception as e:
+                logging.error("Failed to process meeting %s: %s", url, e)
+                result = {'output_folder': str(dest), 'error': str(e)}
+            result.update({'date': date, 'time': time_text, 'url': url})
+            return result
+
+        return await asyncio.gather(*(run(*meeting, dest) for meeting, dest in zip(meetings, folders)))
+
+
+def run_date_range(start_date, end_date, output_root, params=None, **kwargs):
+    """Blocking helper: run AsyncScraperInterface.process_date_range_async to completion"""
+    async def main():
+        async with AsyncScraperInterface(**kwargs) as scraper:
+            return await scraper.process_date_range_async(start_date, end_date, output_root, params)
+    return asyncio.run(main())
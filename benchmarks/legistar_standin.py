@@ -0,0 +1,271 @@
+"""Local stand-in for the Legistar site, for offline benchmarks.
+
+Serves DepartmentDetail, MeetingDetail and LegislationDetail pages and
+View.ashx PDFs shaped like Cupertino's, with configurable latency, bandwidth
+and error injection. Counts requests, TCP connections accepted, bytes sent and
+injected errors.
+
+Pages are synthesized by default. With fixtures=DIR, a recorded page saved as
+DIR/DepartmentDetail.aspx.html (or MeetingDetail/LegislationDetail) is served
+for every request to that page instead. Relative links in recorded pages
+resolve against the stand-in, because the scraper's BASE_URL points at it.
+
+    python benchmarks/legistar_standin.py --port 8765 --latency 0.05   # serve until Ctrl-C
+"""
+import argparse
+import hashlib
+import io
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import fitz  # PyMuPDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from split_header_scan import make_packet  # noqa: E402
+
+YEAR = 2025
+MEETING_DAYS = (3, 17)
+
+
+def meeting_id(month, day):
+    return month * 100 + day
+
+
+def make_pdf(pages, label):
+    """A text PDF of the given page count, as bytes"""
+    doc = fitz.open()
+    for page_no in range(pages):
+        page = doc.new_page()
+        for line in range(45):
+            page.insert_text((72, 60 + 13 * line), f"{label} page {page_no + 1} line {line} lorem ipsum dolor sit amet",
+                             fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class LegistarStandIn:
+    """Threaded HTTP server imitating cupertino.legistar.com; start() it, then point BASE_URL and bodies at base_url"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, bandwidth=None, error_rate=0.0, retry_after=0,
+                 items=8, attachments=3, attachment_pages=4, packet_pages=120, fixtures=None, seed=0,
+                 attachment_name="Attachment {id}.pdf"):
+        # latency:     seconds added before every response
+        # bandwidth:   bytes/second each response body is paced to (None: unlimited)
+        # error_rate:  fraction of requests answered 503 with Retry-After: retry_after
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.items = items
+        self.attachments = attachments
+        # attachment_name: Content-Disposition filename of attachment {id}; a name without
+        # {id} gives every attachment the same filename, as Legistar sometimes does
+        self.attachment_name = attachment_name
+        self.fixtures = Path(fixtures) if fixtures else None
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.bytes_sent = 0
+        self.errors_injected = 0
+        self.attachment_pdf = make_pdf(attachment_pages, "Attachment")
+        # Supplemental packet: one staff report (every 10 pages) per agenda item
+        buffer = io.BytesIO()
+        make_packet(buffer, max(packet_pages, 10 * items + 2))
+        self.packet_pdf = buffer.getvalue()
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def body_url(self, body_id=1):
+        """DepartmentDetail URL for a body registry entry"""
+        return f"{self.base_url}DepartmentDetail.aspx?ID={body_id}&GUID=B{body_id}&Mode=MainBody"
+
+    def meeting_url(self, month=1, day=MEETING_DAYS[0]):
+        return f"{self.base_url}MeetingDetail.aspx?ID={meeting_id(month, day)}&GUID=M"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="legistar-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = self.connections = self.bytes_sent = self.errors_injected = 0
+
+    def counters(self):
+        with self._lock:
+            return {'requests': self.requests, 'connections': self.connections, 'bytes': self.bytes_sent,
+                    'errors_injected': self.errors_injected}
+
+    def _recorded(self, page):
+        if self.fixtures is None:
+            return None
+        path = self.fixtures / f"{page}.html"
+        return path.read_bytes() if path.exists() else None
+
+    def department_page(self):
+        rows = "".join(
+            f'<tr><td>{month}/{day}/{YEAR}</td><td>City Council</td><td>6:00 PM</td><td>Council Chamber</td>'
+            f'<td><a href="MeetingDetail.aspx?ID={meeting_id(month, day)}&GUID=M">Meeting details</a></td></tr>'
+            for month in range(1, 13) for day in MEETING_DAYS
+        )
+        return (f"<html><head><title>City Council</title></head><body><table>"
+                f"<tr><th>Date</th><th>Name</th><th>Time</th><th>Location</th><th>Details</th></tr>{rows}"
+                f"</table></body></html>").encode()
+
+    def meeting_page(self, mid):
+        month, day = divmod(int(mid), 100)
+        items = "".join(
+            f'<tr><td><a href="LegislationDetail.aspx?ID={mid}{i:02d}&GUID=L">{YEAR % 100}-{mid}{i:02d}</a></td>'
+            f'<td>1</td><td>Staff Report</td><td>Agenda Ready</td><td>City Council</td>'
+            f'<td>Subject: Consider item {i} regarding the annual budget</td></tr>'
+            for i in range(1, self.items + 1)
+        )
+        return f'''<html><head><title>City Council - {month}/{day}/{YEAR}</title></head><body>
+<span id="ctl00_ContentPlaceHolder1_lblDate">{month}/{day}/{YEAR}</span>
+<span id="ctl00_ContentPlaceHolder1_lblTime">6:00 PM</span>
+<table><tr><td>Name:</td><td>City Council</td>
+<td>Published agenda:</td><td><a href="View.ashx?M=A&ID={mid}&GUID=A">Agenda</a></td>
+<td>Published minutes:</td><td>Not available</td>
+<td>Meeting Extra1:</td><td><a href="View.ashx?M=E1&ID={mid}&GUID=E">Supplemental Report</a></td>
+<td>Agenda status:</td><td>Final</td></tr></table>
+<table id="ctl00_ContentPlaceHolder1_gridMain_ctl00"><tr><th>File #</th></tr>{items}</table>
+</body></html>'''.encode()
+
+    def legislation_page(self, lid):
+        links = " ".join(
+            f'<a href="View.ashx?M=F&ID={lid}{j}&GUID=F">Attachment {j}</a>' for j in range(1, self.attachments + 1)
+        )
+        return f'''<html><head><title>Legislation {lid}</title>
+<meta name="description" content="Legislation {lid}: consider the item and adopt the resolution"></head><body>
+<span id="ctl00_ContentPlaceHolder1_lblOnAgenda2">1/3/{YEAR} City Council</span>{links}</body></html>'''.encode()
+
+    def respond(self, path, query):
+        """(content type, Content-Disposition, body) for a request path; None for unknown pages"""
+        page = path.rsplit("/", 1)[-1]
+        if page == "DepartmentDetail.aspx":
+            return "text/html; charset=utf-8", None, self._recorded(page) or self.department_page()
+        if page == "MeetingDetail.aspx":
+            return "text/html; charset=utf-8", None, self._recorded(page) or self.meeting_page(query["ID"][0])
+        if page == "LegislationDetail.aspx":
+            return "text/html; charset=utf-8", None, self._recorded(page) or self.legislation_page(query["ID"][0])
+        if page == "View.ashx":
+            kind, doc_id = query.get("M", ["F"])[0], query.get("ID", ["0"])[0]
+            if kind == "E1":
+                name, body = f"Supplemental Report {doc_id}.pdf", self.packet_pdf
+            elif kind == "A":
+                name, body = f"Agenda {doc_id}.pdf", self.attachment_pdf
+            else:
+                name, body = self.attachment_name.format(id=doc_id), self.attachment_pdf
+            return "application/pdf", f'attachment; filename="{name}"', body
+        return None
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                # One handler per accepted connection; keep-alive requests reuse it
+                super().setup()
+                with standin._lock:
+                    standin.connections += 1
+
+            def send(self, status, body=b"", headers=()):
+                """Respond with body; a HEAD gets the same headers (Content-Length included) and no body"""
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command == "HEAD":
+                    return
+                if standin.bandwidth:
+                    chunk = max(1, int(standin.bandwidth / 20))
+                    for start in range(0, len(body), chunk):
+                        self.wfile.write(body[start:start + chunk])
+                        time.sleep(len(body[start:start + chunk]) / standin.bandwidth)
+                else:
+                    self.wfile.write(body)
+                with standin._lock:
+                    standin.bytes_sent += len(body)
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def do_GET(self):
+                with standin._lock:
+                    standin.requests += 1
+                    inject = standin.error_rate and standin._random.random() < standin.error_rate
+                    if inject:
+                        standin.errors_injected += 1
+                if standin.latency:
+                    time.sleep(standin.latency)
+                if inject:
+                    self.send(503, headers=[("Retry-After", str(standin.retry_after))])
+                    return
+                url = urlparse(self.path)
+                response = standin.respond(url.path, parse_qs(url.query))
+                if response is None:
+                    self.send(404)
+                    return
+                content_type, disposition, body = response
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self.send(304, headers=[("ETag", etag)])
+                    return
+                headers = [("Content-Type", content_type), ("ETag", etag)]
+                if disposition:
+                    headers.append(("Content-Disposition", disposition))
+                self.send(200, body, headers)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes/second per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    parser.add_argument("--items", type=int, default=8, help="agenda items per meeting")
+    parser.add_argument("--fixtures", help="directory of recorded <Page>.aspx.html files")
+    args = parser.parse_args()
+    standin = LegistarStandIn(port=args.port, latency=args.latency, bandwidth=args.bandwidth,
+                              error_rate=args.error_rate, items=args.items, fixtures=args.fixtures)
+    print(f"Serving {standin.base_url} (calendar: {standin.body_url()})")
+    try:
+        standin.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
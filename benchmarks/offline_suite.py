@@ -0,0 +1,179 @@
+"""Offline end-to-end benchmarks against a local Legistar stand-in.
+
+Runs the scraper's main paths against benchmarks/legistar_standin.py instead
+of the live site:
+
+- calendar:          date and date-range calendar queries, plus discover_meetings over two bodies
+- process_meeting:   one meeting with its items, attachments, extras and supplemental split
+- split_supplemental: split_supplemental_pdf on the stand-in's supplemental packet (no network)
+
+Each scenario runs in a fresh spawned process, so its peak RSS and its cold
+module-level caches are its own. For every scenario the suite reports wall
+time, requests and bytes served by the stand-in, and peak RSS.
+
+    python benchmarks/offline_suite.py
+    python benchmarks/offline_suite.py --latency 0.05 --bandwidth 2e6 --error-rate 0.05 --workers 4
+    python benchmarks/offline_suite.py --json results.json                   # save a baseline
+    python benchmarks/offline_suite.py --baseline results.json --tolerance 0.25
+        # exits 1 if a scenario is more than 25% slower (or uses more requests/bytes) than the baseline
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from legistar_standin import LegistarStandIn  # noqa: E402
+
+SCENARIOS = ("calendar", "process_meeting", "split_supplemental")
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_scraper(config):
+    from scraper_module import ScraperInterface
+    bodies = {
+        'city_council': {'name': "City Council", 'url': config['body_urls'][0]},
+        'planning_commission': {'name': "Planning Commission", 'url': config['body_urls'][1]},
+    }
+    scraper = ScraperInterface(rate=config['rate'], bodies=bodies, split_workers=config['split_workers'])
+    scraper.BASE_URL = config['base_url']
+    return scraper
+
+
+def run_calendar(config, tmp):
+    with make_scraper(config) as scraper:
+        year = scraper.fetch_meetings_for_date_range("01/01/2025", "12/31/2025")
+        # Repeated single-date lookups are answered from the shared calendar index
+        days = [scraper.fetch_meetings_for_date(f"{month}/3/2025") for month in range(1, 13)]
+        meetings, stats = scraper.discover_meetings("01/01/2025", "06/30/2025", bodies=list(scraper.bodies))
+        return {'meetings_in_year': len(year), 'single_day_hits': sum(map(len, days)),
+                'discovered': len(meetings), 'http': scraper.http_metrics()}
+
+
+def run_process_meeting(config, tmp):
+    with make_scraper(config) as scraper:
+        result = scraper.process_meeting(config['meeting_url'], Path(tmp) / "meeting",
+                                         {'max_workers': config['workers'], 'split_supplemental': True})
+        files = sum(1 for path in (Path(tmp) / "meeting").rglob("*") if path.is_file())
+        return {'items': result['items_count'], 'files': files, 'http': scraper.http_metrics()}
+
+
+def run_split_supplemental(config, tmp):
+    packet = Path(tmp) / "Supplemental Report.pdf"
+    packet.write_bytes(config['packet_pdf'])
+    with make_scraper(config) as scraper:
+        split = scraper.split_supplemental_pdf(packet, [])
+    return {'reports': len(split)}
+
+
+def run_scenario(name, config, queue):
+    """Child process entry point: run one scenario and put its measurements on queue"""
+    # The scraper logs every request (and retry) and prints split progress; keep the report readable
+    logging.disable(logging.WARNING)
+    runner = globals()[f"run_{name}"]
+    try:
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            detail = runner(config, tmp)
+            elapsed = time.perf_counter() - start
+        queue.put({'seconds': elapsed, 'peak_rss_mb': peak_rss_mb(), 'detail': detail})
+    except Exception as e:
+        queue.put({'error': f"{type(e).__name__}: {e}"})
+
+
+def measure(standin, name, config):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    standin.reset_counters()
+    process = context.Process(target=run_scenario, args=(name, config, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    result.update(standin.counters())
+    return result
+
+
+def regressions(results, baseline, tolerance):
+    """Scenario metrics that grew past baseline * (1 + tolerance)"""
+    found = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or 'error' in old:
+            continue
+        for metric in ('seconds', 'requests', 'bytes', 'peak_rss_mb'):
+            if old.get(metric) and result.get(metric, 0) > old[metric] * (1 + tolerance):
+                found.append(f"{name}: {metric} {result[metric]:.6g} vs baseline {old[metric]:.6g}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes/second per response (default unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    parser.add_argument("--items", type=int, default=8, help="agenda items per meeting")
+    parser.add_argument("--attachments", type=int, default=3, help="attachments per agenda item")
+    parser.add_argument("--packet-pages", type=int, default=200, help="pages in the supplemental packet")
+    parser.add_argument("--workers", type=int, default=4, help="process_meeting max_workers")
+    parser.add_argument("--split-workers", type=int, default=1, help="processes scanning the supplemental packet")
+    parser.add_argument("--rate", type=float, default=0, help="scraper requests/second per host (0: unthrottled)")
+    parser.add_argument("--fixtures", help="directory of recorded <Page>.aspx.html files to serve")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="results file from an earlier --json run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed growth over the baseline")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    with LegistarStandIn(latency=args.latency, bandwidth=args.bandwidth, error_rate=args.error_rate,
+                         items=args.items, attachments=args.attachments, packet_pages=args.packet_pages,
+                         fixtures=args.fixtures) as standin:
+        config = {
+            'base_url': standin.base_url,
+            'body_urls': [standin.body_url(1), standin.body_url(2)],
+            'meeting_url': standin.meeting_url(),
+            'packet_pdf': standin.packet_pdf,
+            'rate': args.rate,
+            'workers': args.workers,
+            'split_workers': args.split_workers,
+        }
+        print(f"Stand-in at {standin.base_url}: latency {args.latency}s, bandwidth "
+              f"{args.bandwidth or 'unlimited'} B/s, error rate {args.error_rate}")
+        print(f"{'scenario':<20} {'wall s':>8} {'requests':>9} {'bytes':>12} {'errors':>7} {'peak RSS MB':>12}")
+        results = {}
+        for name in args.scenarios or SCENARIOS:
+            result = results[name] = measure(standin, name, config)
+            if 'error' in result:
+                print(f"{name:<20} FAILED: {result['error']}")
+                continue
+            print(f"{name:<20} {result['seconds']:8.3f} {result['requests']:9d} {result['bytes']:12d} "
+                  f"{result['errors_injected']:7d} {result['peak_rss_mb']:12.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    status = 1 if any('error' in result for result in results.values()) else 0
+    if args.baseline:
+        found = regressions(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}")
+        status = status or (1 if found else 0)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Stress the web app's task ids and progress registry with hundreds of concurrent tasks.
+
+Every task is submitted through POST /scrape, from several client threads at once.
+Each task runs a synthetic scrape that sends the ProgressTracker the same
+events ScraperInterface sends: meeting_started, item_done, file_done and bytes.
+They arrive from a small thread pool, as they do from the item and download
+pools. Reader threads poll /api/progress/<task_id> the whole time.
+
+The run checks that:
+- every submission got its own task id;
+- no poll ever saw a missing task, or progress/counters going backwards;
+- every task finished with exact counters and its result.
+
+    python benchmarks/progress_stress.py --tasks 300 --items 20 --readers 8
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=300, help="tasks to submit")
+    parser.add_argument("--items", type=int, default=20, help="agenda items per synthetic task")
+    parser.add_argument("--files", type=int, default=3, help="files per agenda item")
+    parser.add_argument("--clients", type=int, default=16, help="threads submitting tasks")
+    parser.add_argument("--readers", type=int, default=8, help="threads polling progress")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    # Every store app.py opens at import lives in tmp, never beside the real app
+    os.environ["SCRAPER_TASK_DB"] = os.path.join(tmp, "tasks.sqlite3")
+    os.environ["SCRAPER_SEARCH_DB"] = os.path.join(tmp, "search_index.sqlite3")
+    os.environ["SCRAPER_TEXT_CACHE_DIR"] = os.path.join(tmp, "pdf_text_cache")
+    os.environ["SCRAPER_CACHE_DIR"] = os.path.join(tmp, "http_cache")
+    # Everything runs at once: no task waits in the queue
+    os.environ["SCRAPER_MAX_CONCURRENT_TASKS"] = str(args.tasks)
+    os.environ["SCRAPER_MAX_QUEUED_TASKS"] = str(args.tasks)
+    import logging
+    import app as webapp
+    logging.disable(logging.CRITICAL)
+
+    chunk = 64 * 1024
+    expected_bytes = args.items * args.files * 2 * chunk
+
+    def synthetic_task(task_id, scraper_params, cancel_event=None):
+        tracker = webapp.ProgressTracker(task_id)
+        tracker.update(30, "Processing meeting from URL...")
+        tracker.follow_items(30, 99)
+        tracker.on_event('meeting_started', {'items_total': args.items, 'title': task_id})
+
+        def item(index):
+            for _ in range(args.files):
+                for _ in range(2):
+                    tracker.on_event('bytes', {'count': chunk, 'filename': 'f.pdf'})
+                tracker.on_event('file_done', {'filename': 'f.pdf', 'size': 2 * chunk, 'failed': False})
+            tracker.on_event('item_done', {'index': index, 'subject': f"Item {index}"})
+
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(item, range(1, args.items + 1)))
+        tracker.complete({'task_id': task_id, 'items': args.items})
+
+    webapp.background_scraper_task = synthetic_task
+    client_form = {'mode': 'url', 'url': 'https://example.invalid/MeetingDetail.aspx?ID=1'}
+
+    task_ids = []
+    ids_lock = threading.Lock()
+
+    def submit(_):
+        client = webapp.app.test_client()
+        response = client.post('/scrape', data=client_form)
+        assert response.status_code == 302, response.status_code
+        with client.session_transaction() as session:
+            task_id = session['current_task_id']
+        with ids_lock:
+            task_ids.append(task_id)
+
+    failures = []
+    latencies = []
+    stop = threading.Event()
+
+    def read():
+        client = webapp.app.test_client()
+        last_seen = {}
+        while not stop.is_set():
+            with ids_lock:
+                task_id = random.choice(task_ids) if task_ids else None
+            if task_id is None:
+                time.sleep(0.01)
+                continue
+            start = time.perf_counter()
+            data = client.get(f'/api/progress/{task_id}').get_json()
+            latencies.append(time.perf_counter() - start)
+            if data.get('error'):
+                failures.append(f"{task_id}: {data['error']}")
+                continue
+            seen = (data['progress'], data.get('items_done', 0), data.get('files_done', 0),
+                    data.get('bytes_downloaded', 0))
+            previous = last_seen.get(task_id)
+            if previous and any(now < before for now, before in zip(seen, previous)):
+                failures.append(f"{task_id}: went backwards {previous} -> {seen}")
+            last_seen[task_id] = seen
+
+    readers = [threading.Thread(target=read) for _ in range(args.readers)]
+    for reader in readers:
+        reader.start()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.clients) as pool:
+        list(pool.map(submit, range(args.tasks)))
+    submitted = time.perf_counter() - start
+
+    # Wait for every task to finish
+    deadline = time.monotonic() + 300
+    while time.monotonic() < deadline:
+        if all((webapp.PROGRESS.get(t) or {}).get('completed') for t in task_ids):
+            break
+        time.sleep(0.1)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    client = webapp.app.test_client()
+    for task_id in task_ids:
+        data = client.get(f'/api/progress/{task_id}').get_json()
+        final = (data.get('completed'), data.get('progress'), data.get('items_done'), data.get('items_total'),
+                 data.get('files_done'), data.get('bytes_downloaded'), (data.get('result') or {}).get('task_id'))
+        wanted = (True, 100, args.items, args.items, args.items * args.files, expected_bytes, task_id)
+        if final != wanted:
+            failures.append(f"{task_id}: final {final} != {wanted}")
+
+    unique = len(set(task_ids))
+    print(f"{args.tasks} tasks submitted in {submitted:.2f}s, all finished in {elapsed:.2f}s")
+    print(f"unique task ids: {unique}/{len(task_ids)}; tasks held in memory after completion: {len(webapp.PROGRESS)}")
+    if latencies:
+        latencies.sort()
+        print(f"{len(latencies)} progress polls: median {statistics.median(latencies) * 1000:.2f} ms, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+    if unique != args.tasks:
+        failures.append(f"task id collisions: {args.tasks - unique}")
+    for failure in failures[:20]:
+        print("FAIL", failure)
+    print("OK" if not failures else f"{len(failures)} failures")
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Benchmark header-region boundary detection for supplemental packets.
+
+Times supplemental_scan.find_report_ranges with full-page text extraction
+against the clip-region / first-N-blocks modes, and checks that every mode
+finds the same report ranges and header metadata as full-page extraction.
+
+    python benchmarks/split_header_scan.py                  # synthetic 600-page packet
+    python benchmarks/split_header_scan.py packet.pdf       # a real packet
+    python benchmarks/split_header_scan.py --pages 2000 --clip 0.2 --blocks 6
+
+On the synthetic packet (300-600 pages, best of 3-5 runs), clip 0.25 ran at
+1.2-1.33x full-page speed, first 4 blocks at 0.86-1.04x, and both together at
+1.05-1.41x, so the combined mode was no steadier than clip alone.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from supplemental_scan import find_report_ranges  # noqa: E402
+
+
+def make_packet(path, pages, report_every=10, body_lines=45):
+    """Write a packet with a staff-report header every report_every pages and dense body text"""
+    doc = fitz.open()
+    for page_no in range(pages):
+        page = doc.new_page()
+        if page_no >= 2 and (page_no - 2) % report_every == 0:
+            item = (page_no - 2) // report_every + 1
+            page.insert_text((72, 60), "CITY COUNCIL STAFF REPORT", fontsize=12)
+            page.insert_text((72, 76), "SUPPLEMENTAL 1" if item % 2 else "DESK ITEM", fontsize=10)
+            page.insert_text((72, 92), "Meeting: July 15, 2025", fontsize=10)
+            page.insert_text((72, 108), f"Agenda Item #{item}", fontsize=10)
+            # Subject sits below a typical header clip, as in real packets
+            page.insert_text((72, 260), "Subject", fontsize=10)
+            page.insert_text((140, 260), f"Consider item {item} regarding the annual budget", fontsize=10)
+            top = 300
+        else:
+            top = 60
+        for line in range(body_lines):
+            y = top + 13 * line
+            if y > page.rect.height - 40:
+                break
+            page.insert_text((72, y), f"Body text line {line} on page {page_no} lorem ipsum dolor sit amet "
+                                      f"consectetur adipiscing elit sed do eiusmod", fontsize=9)
+    doc.save(path)
+
+
+def timed(pdf_path, repeat, **kw):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = find_report_ranges(pdf_path, **kw)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf", nargs="?", help="packet to scan (default: generate a synthetic one)")
+    parser.add_argument("--pages", type=int, default=600, help="pages in the synthetic packet")
+    parser.add_argument("--clip", type=float, default=0.25, help="top-of-page fraction to read")
+    parser.add_argument("--blocks", type=int, default=4, help="first N text blocks to read")
+    parser.add_argument("--workers", type=int, default=1, help="scan processes (1: serial)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode; best time is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if not pdf_path:
+            pdf_path = str(Path(tmp) / "packet.pdf")
+            make_packet(pdf_path, args.pages)
+        with fitz.open(pdf_path) as doc:
+            print(f"{pdf_path}: {doc.page_count} pages")
+
+        modes = [
+            ("full page", {}),
+            (f"clip {args.clip}", {"clip": args.clip}),
+            (f"first {args.blocks} blocks", {"blocks": args.blocks}),
+            (f"clip {args.clip} + {args.blocks} blocks", {"clip": args.clip, "blocks": args.blocks}),
+        ]
+        baseline_time, baseline = None, None
+        ok = True
+        for name, kw in modes:
+            elapsed, ranges = timed(pdf_path, args.repeat, workers=args.workers, **kw)
+            if baseline is None:
+                baseline_time, baseline = elapsed, ranges
+            same = ranges == baseline
+            ok &= same
+            print(f"{name:<28} {elapsed:8.3f}s  {baseline_time / elapsed:5.2f}x  "
+                  f"{len(ranges)} reports  {'matches full page' if same else 'MISMATCH'}")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+SORT_KEYS = {
+    'name': lambda entry: entry['name'],
+    'size': lambda entry: (entry['size'], entry['name']),
+    'modified': lambda entry: (entry['mtime'], entry['name']),
+}
+
+
+class ListingCache:
+    """Directory listings cached per directory and invalidated by the directory's mtime.
+
+    A listing is built with one os.scandir pass and one stat per entry. Adding,
+    removing or renaming an entry changes the directory's mtime, which the
+    scraper's downloads always do (they rename a finished .part file into place);
+    an in-place rewrite of an existing file does not, so its size/mtime show
+    what they were when the listing was built. Sorted orders are computed once
+    per listing and reused by every page.
+    """
+
+    def __init__(self, max_dirs=256):
+        self.max_dirs = max_dirs
+        self._lock = threading.Lock()
+        self._listings = OrderedDict()  # real path -> {'mtime_ns', 'entries', 'sorted'}
+        self.hits = 0
+        self.misses = 0
+
+    def _scan(self, path):
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                    st = entry.stat()
+                except OSError:
+                    # Vanished between readdir and stat
+                    continue
+                entries.append({
+                    'name': entry.name,
+                    'is_dir': is_dir,
+                    'size': 0 if is_dir else st.st_size,
+                    'mtime': st.st_mtime,
+                })
+        return entries
+
+    def listing(self, path):
+        """Cached listing for path (raises OSError like os.scandir)"""
+        key = os.path.realpath(path)
+        mtime_ns = os.stat(key).st_mtime_ns
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None and cached['mtime_ns'] == mtime_ns:
+                self._listings.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        listing = {'mtime_ns': mtime_ns, 'entries': self._scan(path), 'sorted': {}}
+        with self._lock:
+            self._listings[key] = listing
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_dirs:
+                self._listings.popitem(last=False)
+        return listing
+
+    def page(self, path, sort='name', descending=False, page=1, per_page=200):
+        """(entries on the requested page, total entry count); page is 1-based.
+
+        Each entry is {name, path, is_dir, size, mtime}, with path joined onto
+        path as given (the cache itself is keyed by the resolved directory).
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort '{sort}'. Use one of: {', '.join(SORT_KEYS)}")
+        listing = self.listing(path)
+        order = listing['sorted'].get((sort, descending))
+        if order is None:
+            # Racing requests may both sort; the result is identical either way
+            order = sorted(listing['entries'], key=SORT_KEYS[sort], reverse=descending)
+            listing['sorted'][(sort, descending)] = order
+        start = (page - 1) * per_page
+        base = Path(path)
+        entries = [dict(entry, path=str(base / entry['name'])) for entry in order[start:start + per_page]]
+        return entries, len(order)
+
+
+# Shared by every request in the process
+LISTING_CACHE = ListingCache()
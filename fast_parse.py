@@ -0,0 +1,153 @@
+"""lxml/XPath fast path for the three Legistar page types the scraper reads.
+
+Each function takes the page HTML as text and returns exactly what the
+BeautifulSoup-based ScraperInterface method of the same name returns, without
+building a BeautifulSoup tree. Text helpers mirror bs4 semantics: ``text`` is
+``Tag.text`` and ``stripped_text`` is ``Tag.get_text(separator, strip=True)``.
+"""
+import logging
+import re
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+EXTRA_LABELS = {
+    "Published agenda",
+    "Published minutes",
+    "Meeting Extra1",
+    "Meeting Extra2",
+    "Meeting Extra3",
+}
+GRID_MAIN = re.compile(r"gridMain", re.IGNORECASE)
+ON_AGENDA = re.compile(r"lblOnAgenda2", re.IGNORECASE)
+
+# XPath text() never selects comment or processing-instruction content, matching bs4
+_TEXT_NODES = etree.XPath(".//text()")
+
+
+def parse_html(html):
+    """Parse page HTML into an lxml tree (raises ValueError/ParserError on unusable input)"""
+    return lxml.html.document_fromstring(html)
+
+
+def text(el):
+    """Equivalent of bs4 Tag.text"""
+    return "".join(_strings(el))
+
+
+def stripped_text(el, separator=""):
+    """Equivalent of bs4 Tag.get_text(separator, strip=True)"""
+    return separator.join(s for s in (s.strip() for s in _strings(el)) if s)
+
+
+def _strings(el):
+    for node in _TEXT_NODES(el):
+        # Script and style contents are not text for bs4's get_text()
+        if node.getparent() is not None and node.getparent().tag in ("script", "style", "template"):
+            if node.is_text:
+                continue
+        yield str(node)
+
+
+def _first(nodes):
+    return nodes[0] if nodes else None
+
+
+def _first_with_id(tree, tag, pattern):
+    for el in tree.iter(tag):
+        if pattern.search(el.get("id", "")):
+            return el
+    return None
+
+
+def parse_calendar_rows(html, base_url):
+    """Fast ScraperInterface.parse_calendar_rows"""
+    tree = parse_html(html)
+    rows = []
+    for row in tree.iter("tr"):
+        cells = row.xpath(".//td")
+        if len(cells) >= 5:
+            date = stripped_text(cells[0])
+            if not date:
+                continue
+            time_text = stripped_text(cells[2])
+            link_tag = _first(cells[4].xpath(".//a[@href]"))
+            if link_tag is not None and "MeetingDetail.aspx" in link_tag.get("href"):
+                rows.append((date, time_text, urljoin(base_url, link_tag.get("href"))))
+    return rows
+
+
+def extract_meeting_extras(tree, base_url):
+    """Fast ScraperInterface.extract_meeting_extras"""
+    extras = []
+    all_tds = list(tree.iter("td"))
+    i = 2  # skip entry 0 and 1
+
+    while i < len(all_tds) - 1:
+        label = stripped_text(all_tds[i]).rstrip(":")
+        if label == "":
+            i += 1
+            continue
+        if label in EXTRA_LABELS:
+            for a in all_tds[i + 1].iter("a"):
+                link_text = text(a).strip()
+                href = urljoin(base_url, a.get("href", "")) if a.get("href") else ""
+                extras.append((label, link_text, href))
+                logging.debug("Extra: %s — %s", label, link_text)
+        i += 2
+
+    return extras
+
+
+def parse_meeting_header(html, base_url):
+    """Fast ScraperInterface.parse_meeting_header: (title, meeting_dt, extras, items)"""
+    tree = parse_html(html)
+    title = text(_first(tree.xpath("//title"))).strip()
+
+    date_span = _first(tree.xpath("//span[@id='ctl00_ContentPlaceHolder1_lblDate']"))
+    meeting_date = text(date_span).strip() if date_span is not None else "Not Found"
+
+    time_span = _first(tree.xpath("//span[@id='ctl00_ContentPlaceHolder1_lblTime']"))
+    meeting_time = text(time_span).strip() if time_span is not None else "Not Found"
+
+    meeting_dt = f"{meeting_date} {meeting_time}"
+    logging.debug("Meeting date/time: %s", meeting_dt)
+
+    extras = extract_meeting_extras(tree, base_url)
+
+    items = []
+    table = _first_with_id(tree, "table", GRID_MAIN)
+    if table is not None:
+        for i, row in enumerate(table.xpath(".//tr")[1:], 1):
+            cols = row.xpath(".//td")
+            if len(cols) >= 6:
+                subj = stripped_text(cols[5], "\n")
+                subj = subj.split("Subject:", 1)[-1].strip()
+                href = _first(cols[0].xpath(".//a[@href]"))
+                if href is not None:
+                    url = urljoin(base_url, href.get("href"))
+                    items.append((i, subj, url))
+                    logging.debug("Item%s: %s", i, subj)
+
+    return title, meeting_dt, extras, items
+
+
+def parse_agenda_item(html, base_url):
+    """Fast ScraperInterface.parse_agenda_item: (item_dt, desc, attachments)"""
+    tree = parse_html(html)
+
+    dt_span = _first_with_id(tree, "span", ON_AGENDA)
+    item_dt = text(dt_span).strip() if dt_span is not None else "Not Found"
+
+    meta = _first(tree.xpath("//meta[@name='description']"))
+    desc = meta.attrib["content"].strip() if meta is not None else ""
+
+    attachments = []
+    for a in tree.xpath("//a[contains(@href, 'View.ashx?M=F')]"):
+        link = urljoin(base_url, a.get("href"))
+        link_text = text(a).strip() or f"Attachment{len(attachments)+1}"
+        attachments.append((link_text, link))
+        logging.debug("Attachment: %s", link_text)
+
+    return item_dt, desc, attachments
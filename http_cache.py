@@ -0,0 +1,248 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# (URL pattern, seconds an entry is served without revalidation); first match wins
+DEFAULT_TTL_RULES = [
+    (r"DepartmentDetail\.aspx|Calendar\.aspx", 15 * 60),   # calendar listings change often
+    (r"MeetingDetail\.aspx", 60 * 60),                      # agendas get amended before the meeting
+    (r"LegislationDetail\.aspx", 24 * 60 * 60),
+    (r"View\.ashx", 30 * 24 * 60 * 60),                     # published documents rarely change
+]
+DEFAULT_TTL = 60 * 60
+# Headers-only entries take no body space, so they are capped by count instead
+DEFAULT_MAX_HEADER_ENTRIES = 50_000
+# Meetings that took place more than PAST_MEETING_GRACE ago are effectively immutable;
+# until then Legistar still adds minutes, video and late attachments
+PAST_MEETING_TTL = 30 * 24 * 60 * 60
+PAST_MEETING_GRACE = 14 * 24 * 60 * 60
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response built from a cache entry"""
+
+    def __init__(self, url, headers, content=None, encoding=None):
+        self.url = url
+        self.status_code = 200
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def raise_for_status(self):
+        pass
+
+
+class HTTPCache:
+    """Persistent HTTP cache: bodies on disk, metadata in SQLite, LRU-evicted to max_bytes
+    (and to max_header_entries headers-only entries).
+
+    Entries within their TTL are served without touching the network; stale
+    entries are revalidated with If-None-Match / If-Modified-Since. Entries may
+    be headers-only (store_body=False), which is how attachments are tracked:
+    the archive copy on disk already is the body.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024, ttl_rules=None, default_ttl=DEFAULT_TTL,
+                 max_header_entries=DEFAULT_MAX_HEADER_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.body_dir = self.cache_dir / "bodies"
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_header_entries = max_header_entries
+        self.ttl_rules = [
+            (re.compile(pattern, re.IGNORECASE), ttl)
+            for pattern, ttl in (ttl_rules if ttl_rules is not None else DEFAULT_TTL_RULES)
+        ]
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.cache_dir / "index.sqlite3", check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                ttl REAL NOT NULL,
+                size INTEGER NOT NULL,
+                has_body INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._db.commit()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def ttl_for(self, url):
+        """TTL policy for url from the first matching rule"""
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def _body_path(self, url):
+        return self.body_dir / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def lookup(self, url, need_body=True):
+        """Return (entry, fresh) for url, or (None, False) when nothing usable is cached"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT headers, encoding, etag, last_modified, stored_at, ttl, has_body FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None or (need_body and not row[6]):
+                self.misses += 1
+                return None, False
+            now = time.time()
+            self._db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (now, url))
+            self._db.commit()
+        headers, encoding, etag, last_modified, stored_at, ttl, has_body = row
+        entry = {
+            'url': url,
+            'headers': json.loads(headers),
+            'encoding': encoding,
+            'etag': etag,
+            'last_modified': last_modified,
+            'has_body': bool(has_body),
+        }
+        fresh = now - stored_at < ttl
+        if fresh:
+            with self._lock:
+                self.hits += 1
+        return entry, fresh
+
+    def conditional_headers(self, entry):
+        """Request headers that revalidate entry"""
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def response_for(self, entry):
+        """Build a CachedResponse for entry, reading the body from disk if it has one"""
+        content = None
+        if entry['has_body']:
+            try:
+                content = self._body_path(entry['url']).read_bytes()
+            except FileNotFoundError:
+                return None
+        return CachedResponse(entry['url'], entry['headers'], content, entry['encoding'])
+
+    def store(self, url, headers, content=None, encoding=None, ttl=None):
+        """Cache a 200 response; pass content=None to keep only its headers"""
+        headers = dict(headers)
+        # Header names as sent (aiohttp keeps "Etag"); validators are matched case-insensitively
+        validators = {name.lower(): value for name, value in headers.items()}
+        size = 0
+        if content is not None:
+            size = len(content)
+            body_path = self._body_path(url)
+            fd, tmp_name = tempfile.mkstemp(dir=self.body_dir, suffix=".part")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(content)
+            os.replace(tmp_name, body_path)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url, json.dumps(headers), encoding,
+                    validators.get("etag"), validators.get("last-modified"),
+                    now, ttl if ttl is not None else self.ttl_for(url),
+                    size, int(content is not None), now,
+                ),
+            )
+            self._db.commit()
+        self.evict()
+
+    def refresh(self, url, headers=None):
+        """Mark url fresh again after a 304 Not Modified, merging any updated validators"""
+        with self._lock:
+            self.revalidated += 1
+            row = self._db.execute("SELECT headers FROM entries WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            merged = json.loads(row[0])
+            for name in ("ETag", "Last-Modified", "Cache-Control", "Expires"):
+                if headers and headers.get(name):
+                    merged[name] = headers[name]
+            self._db.execute(
+                "UPDATE entries SET headers = ?, etag = ?, last_modified = ?, stored_at = ?, last_access = ? WHERE url = ?",
+                (json.dumps(merged), merged.get("ETag"), merged.get("Last-Modified"), time.time(), time.time(), url),
+            )
+            self._db.commit()
+
+    def set_ttl(self, url, ttl):
+        """Override the TTL of an existing entry (e.g. once a meeting is known to be in the past)"""
+        with self._lock:
+            self._db.execute("UPDATE entries SET ttl = ? WHERE url = ?", (ttl, url))
+            self._db.commit()
+
+    def evict(self):
+        """Drop least recently used entries until bodies fit in max_bytes and headers-only
+        entries number at most max_header_entries"""
+        with self._lock:
+            total, headers_only = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0), COALESCE(SUM(has_body = 0), 0) FROM entries"
+            ).fetchone()
+            if total <= self.max_bytes and headers_only <= self.max_header_entries:
+                return
+            victims = []
+            if total > self.max_bytes:
+                for url, size in self._db.execute(
+                    "SELECT url, size FROM entries WHERE has_body = 1 ORDER BY last_access"
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    victims.append(url)
+                    total -= size
+                self._db.executemany("DELETE FROM entries WHERE url = ?", [(url,) for url in victims])
+            dropped = 0
+            if headers_only > self.max_header_entries:
+                # No body files to remove for these
+                dropped = self._db.execute(
+                    "DELETE FROM entries WHERE url IN "
+                    "(SELECT url FROM entries WHERE has_body = 0 ORDER BY last_access LIMIT ?)",
+                    (headers_only - self.max_header_entries,),
+                ).rowcount
+            self._db.commit()
+        for url in victims:
+            try:
+                self._body_path(url).unlink()
+            except FileNotFoundError:
+                pass
+        logging.debug("HTTP cache evicted %s entries and %s headers-only entries", len(victims), dropped)
+
+    def stats(self):
+        """Return hit/revalidation/miss counters and the cache's current size"""
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'entries': entries,
+                'bytes': size,
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
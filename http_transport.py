@@ -0,0 +1,228 @@
+import email.utils
+import random
+import threading
+import time
+import logging
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+import scrape_metrics
+
+# Responses worth retrying: throttling and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Per-host token bucket shared by every thread using the transport"""
+
+    def __init__(self, rate=0, burst=8):
+        # rate:  sustained requests per second per host (0: no throttling, pauses still apply)
+        # burst: requests a host may receive back to back before throttling kicks in
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets = {}   # host -> (tokens, last refill time)
+        self._paused = {}    # host -> monotonic time before which nothing is sent
+
+    def reserve(self, host):
+        """Take one token for host and return how many seconds the caller must wait first"""
+        with self._lock:
+            now = time.monotonic()
+            if not self.rate:
+                return self._paused.get(host, 0.0) - now
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            tokens -= 1
+            self._buckets[host] = (tokens, now)
+            delay = -tokens / self.rate if tokens < 0 else 0.0
+            # A server-requested pause (Retry-After / backoff) applies to every caller
+            return max(delay, self._paused.get(host, 0.0) - now)
+
+    def acquire(self, host):
+        """Block until a request to host may be sent; return the time waited"""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+        return max(delay, 0.0)
+
+    def pause(self, host, seconds):
+        """Hold back all requests to host for the given number of seconds"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._paused[host] = max(self._paused.get(host, 0.0), until)
+
+
+class HTTPTransport:
+    """Shared, pooled HTTP transport used by every ScraperInterface fetch path"""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=True, timeout=60,
+                 rate=0, burst=8, max_retries=4, backoff_base=1.0, backoff_max=60.0, cache=None):
+        # pool_connections: number of per-host pools kept alive
+        # pool_maxsize:     max keep-alive connections per host
+        # pool_block:       block instead of opening extra connections past pool_maxsize
+        # rate/burst:       per-host token bucket, opt-in (rate=0: unthrottled; Retry-After pauses still apply).
+        #                   A rate caps every worker pool sharing this transport, however many threads they have
+        # max_retries:      retries on 429/5xx/connection errors, with jittered exponential backoff
+        # cache:            optional http_cache.HTTPCache consulted by fetch()
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.cache = cache
+        self.rate_limiter = RateLimiter(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.retries = 0
+        self.rate_limit_wait = 0.0
+        self.backoff_wait = 0.0
+
+    def backoff_delay(self, attempt, response=None):
+        """Seconds to wait before retry number attempt (0-based), honoring Retry-After"""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        # Full jitter: spreads retries from parallel workers instead of synchronizing them
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def wait_for_slot(self, url):
+        """Block on the per-host rate limiter before sending a request to url"""
+        self.record_request(self.rate_limiter.acquire(urlparse(url).netloc))
+
+    def record_request(self, waited):
+        """Account for one request sent after waiting waited seconds on the rate limiter"""
+        with self._lock:
+            self.requests_sent += 1
+            self.rate_limit_wait += waited
+        scrape_metrics.count('requests')
+
+    def record_retry(self, url, delay, reason):
+        """Account for a retry and hold back the host for delay seconds"""
+        logging.warning("Retrying %s in %.1fs (%s)", url, delay, reason)
+        self.rate_limiter.pause(urlparse(url).netloc, delay)
+        with self._lock:
+            self.retries += 1
+            self.backoff_wait += delay
+        scrape_metrics.count('retries')
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the rate limiter, retrying throttled and failed attempts"""
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            self.wait_for_slot(url)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                self.record_retry(url, delay, type(e).__name__)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = self.backoff_delay(attempt, response)
+                response.close()
+                self.record_retry(url, delay, f"HTTP {response.status_code}")
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        """Issue a GET through the pooled session"""
+        return self.request("GET", url, **kwargs)
+
+    def fetch(self, url, revalidate=False):
+        """GET a page through the HTTP cache, revalidating stale entries, when a cache is configured
+
+        revalidate=True asks the server even if the cached entry is still fresh.
+        """
+        cache = self.cache
+        if cache is None:
+            return self.get(url)
+        entry, fresh = cache.lookup(url)
+        if fresh and not revalidate:
+            cached = cache.response_for(entry)
+            if cached is not None:
+                scrape_metrics.count('cache_hits')
+                return cached
+        response = self.get(url, headers=cache.conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            cached = cache.response_for(entry)
+            if cached is not None:
+                cache.refresh(url, response.headers)
+                scrape_metrics.count('cache_revalidated')
+                return cached
+            # Body vanished from disk; fetch it unconditionally
+            response = self.get(url)
+        if response.status_code == 200:
+            cache.store(url, response.headers, response.content, response.encoding or response.apparent_encoding)
+        return response
+
+    def head(self, url, **kwargs):
+        """Issue a HEAD through the pooled session (how re-scrapes find attachments already on disk)"""
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("HEAD", url, **kwargs)
+
+    def connection_stats(self):
+        """Return connections opened versus reused across all live host pools"""
+        opened = 0
+        pooled_requests = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            pooled_requests += pool.num_requests
+        return {
+            'requests': self.requests_sent,
+            'connections_opened': opened,
+            'connections_reused': max(pooled_requests - opened, 0),
+            'hosts': len(pools),
+        }
+
+    def metrics(self):
+        """Return request, retry and wait-time counters along with connection stats"""
+        stats = self.connection_stats()
+        with self._lock:
+            stats.update({
+                'retries': self.retries,
+                'rate_limit_wait_seconds': round(self.rate_limit_wait, 3),
+                'backoff_wait_seconds': round(self.backoff_wait, 3),
+            })
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+    def close(self):
+        """Close all pooled connections"""
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            # metrics() takes locks and walks the pools; skip it when nobody will see it
+            logging.debug("Closing HTTP transport: %s", self.metrics())
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds, or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+# Legistar bodies (departments) we know how to scrape, keyed by a short slug.
+# "url" is the DepartmentDetail page whose meeting table lists that body's calendar.
+LEGISTAR_BODIES = {
+    'city_council': {
+        'name': "City Council",
+        'url': (
+            "https://cupertino.legistar.com/DepartmentDetail.aspx?"
+            "ID=22534&GUID=759DE527-B7CF-4B4C-88AB-B83875AB732D&Mode=MainBody"
+        ),
+    },
+    'planning_commission': {
+        'name': "Planning Commission",
+        'url': (
+            "https://cupertino.legistar.com/DepartmentDetail.aspx?"
+            "ID=22538&GUID=D3B7D79F-7049-469E-8B05-0E51C580B6E5&Mode=MainBody"
+        ),
+    },
+}
+
+DEFAULT_BODY = 'city_council'
+
+
+def load_body_registry(path=None):
+    """Return the body registry, extended/overridden by a JSON file of {slug: {name, url}}"""
+    bodies = {slug: dict(body) for slug, body in LEGISTAR_BODIES.items()}
+    if path:
+        extra = json.loads(Path(path).read_text(encoding="utf-8"))
+        for slug, body in extra.items():
+            if not body.get('url'):
+                raise ValueError(f"Body '{slug}' in {path} has no url")
+            bodies[slug] = {'name': body.get('name', slug), 'url': body['url']}
+    return bodies
@@ -0,0 +1,86 @@
+"""Logging configuration for the web app and command-line entry points.
+
+    SCRAPER_LOG_LEVEL   root level: DEBUG, INFO (default), WARNING, ...
+    SCRAPER_LOG_QUEUE   1: callers only enqueue records; a background thread formats and writes them
+                        (see DeferredQueueHandler)
+    SCRAPER_LOG_FILE    write to this file instead of stderr
+
+Modules log through the root logger with %-style arguments, so a record below
+the configured level costs one level check and is never formatted.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"
+
+_configured = False
+_listener = None
+
+# Argument types that cannot change between the log call and the listener formatting them
+IMMUTABLE_ARGS = (str, bytes, int, float, bool, type(None))
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    QueueHandler.prepare() formats every record in the calling thread so the
+    record can be pickled. The queue here is in-process, so the record is
+    enqueued as-is. Only when an argument is mutable, and could change before
+    the listener gets to it, is the message merged in the caller.
+    """
+
+    def prepare(self, record):
+        args = record.args
+        if isinstance(args, dict):
+            args = args.values()
+        if args and not all(isinstance(arg, IMMUTABLE_ARGS) for arg in args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def parse_level(level):
+    """logging level for a name ("debug", "INFO") or number; ValueError if unknown"""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).strip().upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level '{level}'")
+    return value
+
+
+def configure_logging(level=None, use_queue=None, log_file=None):
+    """Set up the root logger once; later calls only change its level.
+
+    Arguments default to the SCRAPER_LOG_* environment variables.
+    """
+    global _configured, _listener
+    root = logging.getLogger()
+    level = parse_level(level or os.environ.get("SCRAPER_LOG_LEVEL") or logging.INFO)
+    root.setLevel(level)
+    if _configured:
+        return
+    _configured = True
+
+    if use_queue is None:
+        use_queue = os.environ.get("SCRAPER_LOG_QUEUE", "").lower() in ("1", "true", "yes")
+    log_file = log_file or os.environ.get("SCRAPER_LOG_FILE")
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Replace handlers left by an earlier basicConfig so records aren't written twice
+    for old in root.handlers[:]:
+        root.removeHandler(old)
+    if use_queue:
+        records = queue.SimpleQueue()
+        root.addHandler(DeferredQueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        # Flush what is still queued before the interpreter exits
+        atexit.register(_listener.stop)
+    else:
+        root.addHandler(handler)
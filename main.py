@@ -1,4 +1,13 @@
-from app import app
+import os
+
+from log_setup import configure_logging
+
+# Spawned PDF-scan workers re-import this module as __mp_main__; only the server
+# process builds the app (task store, search index, queue threads)
+if __name__ != '__mp_main__':
+    from app import app
 
 if __name__ == '__main__':
+    # Development server: full debug logging unless SCRAPER_LOG_LEVEL says otherwise
+    configure_logging(os.environ.get("SCRAPER_LOG_LEVEL", "DEBUG"))
     app.run(host='0.0.0.0', port=5000, debug=True)
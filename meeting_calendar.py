@@ -0,0 +1,78 @@
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+
+class MeetingCalendar:
+    """Meetings from one department page, indexed for date and date-range lookups.
+
+    Rows are (date string, time string, meeting URL) as returned by
+    ScraperInterface.parse_calendar_rows. Dates are parsed once, when the index
+    is built; range queries are a pair of bisects over the sorted dates.
+    """
+
+    def __init__(self, rows):
+        self.by_date = {}
+        dated = []
+        for row in rows:
+            self.by_date.setdefault(row[0], []).append(row)
+            try:
+                dated.append((datetime.strptime(row[0], '%m/%d/%Y'), row))
+            except ValueError:
+                # Rows with invalid date formats can only be found by exact date string
+                continue
+        # Stable sort, so same-day meetings keep page order
+        dated.sort(key=lambda pair: pair[0])
+        self._dates = [dt for dt, row in dated]
+        self._rows = [row for dt, row in dated]
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.by_date.values())
+
+    def on_date(self, date_str):
+        """Meetings whose calendar date string equals date_str, in page order"""
+        return list(self.by_date.get(date_str, []))
+
+    def in_range(self, start_dt, end_dt):
+        """Meetings dated within [start_dt, end_dt], sorted by date"""
+        lo = bisect_left(self._dates, start_dt)
+        hi = bisect_right(self._dates, end_dt)
+        return self._rows[lo:hi]
+
+
+class CalendarCache:
+    """Process-wide TTL cache of MeetingCalendar indexes keyed by department page URL"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}      # url -> (built_at, MeetingCalendar)
+        self._build_locks = {}  # url -> lock, so concurrent misses fetch the page once
+
+    def get(self, url, build, ttl):
+        """Return the cached calendar for url, calling build() when missing or older than ttl"""
+        entry = self._entries.get(url)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        with self._lock:
+            build_lock = self._build_locks.setdefault(url, threading.Lock())
+        with build_lock:
+            # Another thread may have rebuilt it while we waited
+            entry = self._entries.get(url)
+            if entry and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            calendar = build()
+            self._entries[url] = (time.monotonic(), calendar)
+            return calendar
+
+    def invalidate(self, url=None):
+        """Drop one cached calendar, or all of them"""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(url, None)
+
+
+# Shared by every ScraperInterface in the process (the web app creates one per task)
+CALENDAR_CACHE = CalendarCache()
@@ -0,0 +1,63 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+
+MANIFEST_NAME = "meeting_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def utc_now():
+    """Timestamp format used for every fetched_at field in the manifest"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """Hash a file on disk without loading it whole"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(folder):
+    """Return the manifest stored in a meeting folder, or None if missing/unreadable"""
+    path = folder / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning("Ignoring unreadable manifest %s: %s", path, e)
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(folder, manifest):
+    """Atomically write the manifest into a meeting folder"""
+    manifest = dict(manifest, version=MANIFEST_VERSION)
+    fd, tmp_name = tempfile.mkstemp(dir=folder, prefix=".", suffix=".part")
+    with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+        json.dump(manifest, tmp, indent=2)
+    os.chmod(tmp_name, 0o644)
+    os.replace(tmp_name, folder / MANIFEST_NAME)
+
+
+def files_present(folder, records):
+    """True when every downloaded file recorded for a folder is still on disk"""
+    return all((folder / record['filename']).exists() for record in records)
+
+
+def merge_hashes(records, previous_records):
+    """Carry sha256 values forward for files that were skipped because they already existed"""
+    previous = {(r['url'], r['filename']): r for r in previous_records or []}
+    for record in records:
+        old = previous.get((record['url'], record['filename']))
+        if old and record.get('sha256') is None and old.get('size') == record.get('size'):
+            record['sha256'] = old.get('sha256')
+    return records
@@ -0,0 +1,151 @@
+"""On-disk cache of per-page PDF text, keyed by the document's content hash.
+
+Each document is one file, ``<sha256[:2]>/<sha256>.txtz``: a small header, a
+table of page offsets, then every page's text zlib-compressed on its own, so a
+single page can be read without loading the rest. The same document saved
+under different names (or in different meetings) is extracted once. Other
+per-page extractions of a document (e.g. just the header region) are stored
+beside it as ``<sha256>.<variant>.txtz``.
+"""
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from meeting_manifest import file_sha256
+
+MAGIC = b"PDFTXT1\n"
+_COUNT = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+
+
+def extract_page_texts(pdf_path, start=0, stop=None):
+    """Full text of pages [start, stop) of a PDF"""
+    with fitz.open(pdf_path) as doc:
+        stop = doc.page_count if stop is None else stop
+        return [doc[page_no].get_text() for page_no in range(start, stop)]
+
+
+class PageTexts(Sequence):
+    """Lazily loaded page texts of one cached document; each access reads one page"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a page text file")
+            (count,) = _COUNT.unpack(f.read(_COUNT.size))
+            table = f.read(_OFFSET.size * (count + 1))
+        self._offsets = [_OFFSET.unpack_from(table, i * _OFFSET.size)[0] for i in range(count + 1)]
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return zlib.decompress(f.read(end - start)).decode("utf-8")
+
+
+class PdfTextCache:
+    """Per-page text of PDFs, extracted once per unique document and shared by every reader"""
+
+    def __init__(self, cache_dir, max_hashes=4096):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_hashes = max_hashes
+        self._lock = threading.Lock()
+        # (path, size, mtime_ns) -> sha256, so an unchanged file is hashed once per process;
+        # least recently used keys beyond max_hashes are dropped
+        self._hashes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def document_hash(self, pdf_path):
+        """Content hash of a PDF, memoized while its size and mtime are unchanged"""
+        st = os.stat(pdf_path)
+        key = (os.path.realpath(pdf_path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            digest = self._hashes.get(key)
+            if digest is not None:
+                self._hashes.move_to_end(key)
+                return digest
+        digest = file_sha256(pdf_path)
+        with self._lock:
+            self._hashes[key] = digest
+            self._hashes.move_to_end(key)
+            while len(self._hashes) > self.max_hashes:
+                self._hashes.popitem(last=False)
+        return digest
+
+    def _text_path(self, digest, variant=None):
+        name = f"{digest}.{variant}.txtz" if variant else f"{digest}.txtz"
+        return self.cache_dir / digest[:2] / name
+
+    def get(self, pdf_path, variant=None):
+        """Cached PageTexts for a PDF (full page text, or the named variant), or None"""
+        text_path = self._text_path(self.document_hash(pdf_path), variant)
+        try:
+            texts = PageTexts(text_path)
+        except (FileNotFoundError, ValueError, struct.error):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return texts
+
+    def put(self, pdf_path, texts, variant=None):
+        """Store the page texts of a PDF (atomically) and return them as PageTexts"""
+        text_path = self._text_path(self.document_hash(pdf_path), variant)
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        blobs = [zlib.compress(text.encode("utf-8")) for text in texts]
+        offset = len(MAGIC) + _COUNT.size + _OFFSET.size * (len(blobs) + 1)
+        offsets = [offset]
+        for blob in blobs:
+            offset += len(blob)
+            offsets.append(offset)
+        fd, tmp_name = tempfile.mkstemp(dir=text_path.parent, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(MAGIC)
+                tmp.write(_COUNT.pack(len(blobs)))
+                tmp.write(b"".join(_OFFSET.pack(o) for o in offsets))
+                for blob in blobs:
+                    tmp.write(blob)
+            os.replace(tmp_name, text_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return PageTexts(text_path)
+
+    def pages(self, pdf_path, extract=extract_page_texts, variant=None):
+        """Page texts of a PDF from the cache, extracting (with extract(pdf_path)) and storing them on a miss.
+
+        variant names a different extraction than full page text; extract must produce it.
+        """
+        texts = self.get(pdf_path, variant)
+        if texts is None:
+            texts = self.put(pdf_path, extract(pdf_path), variant)
+        return texts
+
+    def stats(self):
+        """Cache hits and misses since start-up"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,157 @@
+"""Per-phase timing and counters for the scrape pipeline.
+
+Every timed phase and counted event is recorded twice: into the PhaseTimings
+of the meeting being processed (found through a context variable, so item
+and download pool threads report to the right meeting), and into the
+process-wide METRICS registry that app.py serves in Prometheus text format.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+PHASES = (
+    'calendar_fetch', 'meeting_fetch', 'parse', 'item_fetch',
+    'attachment_download', 'supplemental_split', 'search_index',
+)
+
+_current = contextvars.ContextVar("scrape_timings", default=None)
+
+
+class PhaseTimings:
+    """Seconds and calls per phase plus named counters; safe to share between threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases = {}    # phase -> [seconds, calls]
+        self.counters = {}  # e.g. requests, retries, cache_hits, bytes_html, bytes_downloaded
+
+    def add_phase(self, phase, seconds):
+        with self._lock:
+            totals = self.phases.setdefault(phase, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        """{'phases': {phase: {seconds, calls}}, **counters}, phases in pipeline order"""
+        with self._lock:
+            order = [phase for phase in PHASES if phase in self.phases]
+            order += sorted(set(self.phases) - set(PHASES))
+            phases = {
+                phase: {'seconds': round(self.phases[phase][0], 3), 'calls': self.phases[phase][1]}
+                for phase in order
+            }
+            return dict(self.counters, phases=phases)
+
+
+class MetricsRegistry:
+    """Process-wide labelled counters, rendered in the Prometheus text exposition format"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help = {}    # name -> (type, help)
+        self._values = {}  # name -> {sorted label items: value}
+
+    def describe(self, name, kind, help_text):
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name, value=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def snapshot(self):
+        """{name: {label items: value}} copy of every counter"""
+        with self._lock:
+            return {name: dict(series) for name, series in self._values.items()}
+
+    def render(self, samples=()):
+        """Exposition text for every counter plus (name, type, help, value, labels) samples taken by the caller"""
+        lines = []
+        for name, series in sorted(self.snapshot().items()):
+            kind, help_text = self._help.get(name, ('counter', name))
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            lines += [f"{name}{_labels(key)} {_number(value)}" for key, value in sorted(series.items())]
+        described = set()
+        for name, kind, help_text, value, labels in samples:
+            if name not in described:
+                described.add(name)
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            lines.append(f"{name}{_labels(tuple(sorted(labels.items())))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key):
+    if not key:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in key)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(key, escaped)) + "}"
+
+
+def _number(value):
+    return repr(round(value, 6)) if isinstance(value, float) else str(value)
+
+
+METRICS = MetricsRegistry()
+METRICS.describe('scraper_phase_seconds_total', 'counter', "Seconds spent in each scrape phase")
+METRICS.describe('scraper_phase_calls_total', 'counter', "Times each scrape phase ran")
+METRICS.describe('scraper_requests_total', 'counter', "HTTP requests sent, retries included")
+METRICS.describe('scraper_retries_total', 'counter', "HTTP requests retried after a throttle, 5xx or connection error")
+METRICS.describe('scraper_cache_hits_total', 'counter', "Pages and file headers answered from the HTTP cache without a request")
+METRICS.describe('scraper_cache_revalidated_total', 'counter', "Cached pages confirmed unchanged by a 304")
+METRICS.describe('scraper_bytes_html_total', 'counter', "Bytes of HTML pages fetched")
+METRICS.describe('scraper_bytes_downloaded_total', 'counter', "Bytes of attachments written to disk")
+
+
+def _targets(also):
+    """The current timings and those in also, each once"""
+    targets = {id(timings): timings for timings in (_current.get(), *also) if timings is not None}
+    return targets.values()
+
+
+@contextmanager
+def collect(timings):
+    """Record phases and counts from this thread (and pools started via propagate) into timings"""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def propagate(fn):
+    """Wrap fn so that, run on a pool thread, it reports to the caller's current timings"""
+    timings = _current.get()
+    if timings is None:
+        return fn
+
+    def run(*args, **kwargs):
+        with collect(timings):
+            return fn(*args, **kwargs)
+    return run
+
+
+@contextmanager
+def phase(name, *also):
+    """Time a block as one call of phase name (into the current timings and any in also)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        METRICS.inc('scraper_phase_seconds_total', elapsed, phase=name)
+        METRICS.inc('scraper_phase_calls_total', phase=name)
+        for timings in _targets(also):
+            timings.add_phase(name, elapsed)
+
+
+def count(name, value=1, *also):
+    """Add value to counter name (scraper_<name>_total, the current timings and any in also)"""
+    METRICS.inc(f'scraper_{name}_total', value)
+    for timings in _targets(also):
+        timings.count(name, value)
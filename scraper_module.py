@@ -1,25 +1,170 @@
-import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, parse_qs
 import re
 from pathlib import Path
 import mimetypes
+import hashlib
 import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import fitz  # PyMuPDF
+import requests
+from lxml import etree
+import fast_parse
+import scrape_metrics
+from supplemental_scan import find_report_ranges
+from http_transport import HTTPTransport
+from http_cache import HTTPCache, CachedResponse, PAST_MEETING_TTL, PAST_MEETING_GRACE
+from meeting_calendar import MeetingCalendar, CALENDAR_CACHE
+from legistar_bodies import LEGISTAR_BODIES, DEFAULT_BODY
+from meeting_manifest import (
+    MANIFEST_NAME, load_manifest, save_manifest, files_present, merge_hashes, utc_now,
+)
+
+class ScrapeCancelled(Exception):
+    """Raised inside a scrape whose params['cancel_event'] has been set"""
+
+class FilenameClaims:
+    """Filenames taken by one batch of downloads into a folder.
+
+    Filenames come from response headers, so two attachments can resolve to the
+    same name. Claims are granted in batch order, whichever download gets its
+    headers first, so the second "report.pdf" is always "report (2).pdf" and a
+    re-scrape maps every URL to the same file again.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._names = {}     # position -> claimed filename
+        self._done = set()   # positions that claimed a name or gave up
+        self._next = 0       # lowest position not yet done
+
+    def claim(self, position, filename):
+        """Filename for the download at position: filename, or filename with a (2), (3)... suffix"""
+        with self._cond:
+            if position in self._names:
+                return self._names[position]
+            self._cond.wait_for(lambda: self.ready(position))
+            taken = {name.lower() for name in self._names.values()}
+            path = Path(filename)
+            name, n = filename, 2
+            while name.lower() in taken:
+                name = f"{path.stem} ({n}){path.suffix}"
+                n += 1
+            self._names[position] = name
+            self._finish(position)
+            return name
+
+    def ready(self, position):
+        """True once every download before position has claimed a name or given up"""
+        return position in self._names or self._next >= position
+
+    def release(self, position):
+        """Let later downloads claim without waiting for position (it failed, or is done)"""
+        with self._cond:
+            self._finish(position)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+    def _finish(self, position):
+        self._done.add(position)
+        while self._next in self._done:
+            self._next += 1
+        self._cond.notify_all()
 
 class ScraperInterface:
     """Interface class for the Cupertino meeting scraper"""
     
-    def __init__(self):
+    def __init__(self, pool_connections=10, pool_maxsize=10, transport=None, chunk_size=64 * 1024,
+                 rate=0, burst=8, max_retries=4, cache_dir=None, cache_max_bytes=512 * 1024 * 1024,
+                 calendar_ttl=300, body=DEFAULT_BODY, bodies=None, parser="lxml", split_workers=None,
+                 split_header_clip=None, split_header_blocks=None, progress_callback=None,
+                 search_index=None, text_cache=None):
         self.BASE_URL = "https://cupertino.legistar.com/"
         self.CALENDAR_URL = "https://cupertino.legistar.com/calendar.aspx"
-        self.CITY_COUNCIL_PAGE = (
-            "https://cupertino.legistar.com/DepartmentDetail.aspx?"
-            "ID=22534&GUID=759DE527-B7CF-4B4C-88AB-B83875AB732D&Mode=MainBody"
+        self.CITY_COUNCIL_PAGE = LEGISTAR_BODIES['city_council']['url']
+        # Registry of scrapable bodies (see legistar_bodies.load_body_registry)
+        self.bodies = bodies or LEGISTAR_BODIES
+        if body not in self.bodies:
+            raise ValueError(f"Unknown body '{body}'. Known bodies: {', '.join(sorted(self.bodies))}")
+        self.body = body
+        # Department page whose calendar the date queries read
+        self.DEPARTMENT_PAGE = self.bodies[body]['url']
+        # One pooled keep-alive transport shared by every fetch path; it also
+        # owns the per-host rate limiter and the retry/backoff policy
+        self.transport = transport or HTTPTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            rate=rate,
+            burst=burst,
+            max_retries=max_retries,
+            cache=HTTPCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir else None,
         )
+        # Attachments are streamed in chunks of this many bytes, so peak
+        # memory per download is bounded by chunk_size, not file size
+        self.chunk_size = chunk_size
+        # Seconds a parsed department calendar is shared before being refetched
+        self.calendar_ttl = calendar_ttl
+        # "lxml": targeted XPath extraction (fast_parse); "soup": full BeautifulSoup trees
+        if parser not in ("lxml", "soup"):
+            raise ValueError(f"Unknown parser '{parser}'. Use 'lxml' or 'soup'")
+        self.parser = parser
+        # Processes used to scan large supplemental packets (None: one per CPU)
+        self.split_workers = split_workers
+        # Boundary detection reads only the top split_header_clip of each page
+        # and/or its first split_header_blocks text blocks (None: full page).
+        # Use clip; blocks alone is slower than full-page text (see header_text)
+        if split_header_clip is not None and not 0 < split_header_clip <= 1:
+            raise ValueError("split_header_clip must be a page-height fraction in (0, 1]")
+        self.split_header_clip = split_header_clip
+        self.split_header_blocks = split_header_blocks
+        # progress_callback(event, data) receives fine-grained progress events:
+        # meeting_started, item_done, file_done and bytes (see report_progress)
+        self.progress_callback = progress_callback
+        # search_index.SearchIndex updated with each processed meeting folder (None: no indexing)
+        self.search_index = search_index
+        # pdf_text_cache.PdfTextCache shared with the search index: packets are
+        # extracted once, and split reports are seeded from the packet's pages
+        self.text_cache = text_cache
+        # Phase times and byte counts across everything this scraper has run (one task in the web app)
+        self.timings = scrape_metrics.PhaseTimings()
+
+    def report_progress(self, event, **data):
+        """Send a progress event to progress_callback; callback errors never break the scrape"""
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback(event, data)
+        except Exception as e:
+            logging.warning("Progress callback failed on %s: %s", event, e)
+
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def connection_stats(self):
+        """Return HTTP connections opened versus reused by this scraper"""
+        return self.transport.connection_stats()
+
+    def http_metrics(self):
+        """Return request, retry and rate-limit wait counters for this scraper"""
+        return self.transport.metrics()
+
+    def timed(self, phase):
+        """Context manager timing a block as one call of a scrape_metrics.PHASES phase"""
+        return scrape_metrics.phase(phase, self.timings)
+
+    def metrics_summary(self):
+        """Phase times and byte counts across this scraper's lifetime, with its HTTP metrics"""
+        return dict(self.timings.summary(), http=self.http_metrics())
 
     def sanitize_filename(self, name):
         """Sanitize filename for safe filesystem storage"""
@@ -30,37 +175,61 @@ class ScraperInterface:
             sanitized = sanitized[:100].rstrip('_')
         return sanitized
 
+    def fetch_html(self, url, revalidate=False):
+        """Fetch HTML text from URL (revalidate: bypass a fresh HTTP cache entry)"""
+        logging.debug("Fetching: %s", url)
+        resp = self.transport.fetch(url, revalidate=revalidate)
+        resp.raise_for_status()
+        scrape_metrics.count('bytes_html', len(resp.content), self.timings)
+        return resp.text
+
     def fetch_soup(self, url):
         """Fetch and parse HTML from URL"""
-        logging.debug(f"Fetching: {url}")
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "lxml")
+        return BeautifulSoup(self.fetch_html(url), "lxml")
 
-    def fetch_meetings_for_date(self, target_date):
-        """Return list of tuples: (date string, time string, full meeting URL)"""
-        soup = self.fetch_soup(self.CITY_COUNCIL_PAGE)
-        matches = []
-        
+    def _fast_parse(self, parse, html):
+        """Run a fast_parse function, or return None to fall back to BeautifulSoup"""
+        if self.parser != "lxml":
+            return None
+        try:
+            return parse(html, self.BASE_URL)
+        except (ValueError, etree.ParserError) as e:
+            logging.debug("Fast parser failed (%s); falling back to BeautifulSoup", e)
+            return None
+
+    def parse_calendar_page(self, html):
+        """parse_calendar_rows for raw department page HTML"""
+        rows = self._fast_parse(fast_parse.parse_calendar_rows, html)
+        return rows if rows is not None else self.parse_calendar_rows(BeautifulSoup(html, "lxml"))
+
+    def parse_meeting_page(self, html, meeting_url):
+        """parse_meeting_header for raw MeetingDetail HTML"""
+        header = self._fast_parse(fast_parse.parse_meeting_header, html)
+        return header if header is not None else self.parse_meeting_header(BeautifulSoup(html, "lxml"), meeting_url)
+
+    def parse_agenda_item_page(self, html):
+        """parse_agenda_item for raw LegislationDetail HTML"""
+        item = self._fast_parse(fast_parse.parse_agenda_item, html)
+        return item if item is not None else self.parse_agenda_item(BeautifulSoup(html, "lxml"))
+
+    def parse_calendar_rows(self, soup):
+        """Return (date string, time string, full meeting URL) for every meeting row on a department page"""
+        rows = []
         for row in soup.find_all("tr"):
             cells = row.find_all("td")
             if len(cells) >= 5:
                 date = cells[0].get_text(strip=True)
-                if target_date != date:
+                if not date:
                     continue
-                time = cells[2].get_text(strip=True)
+                time_text = cells[2].get_text(strip=True)
                 link_tag = cells[4].find("a", href=True)
                 if link_tag and "MeetingDetail.aspx" in link_tag["href"]:
                     detail_url = urljoin(self.BASE_URL, link_tag["href"])
-                    matches.append((date, time, detail_url))
-        
-        return matches
+                    rows.append((date, time_text, detail_url))
+        return rows
 
-    def fetch_meetings_for_date_range(self, start_date, end_date):
-        """Return list of tuples for meetings in date range: (date string, time string, full meeting URL)"""
-        from datetime import datetime
-        
-        # Parse dates
+    def parse_date_range(self, start_date, end_date):
+        """Validate an MM/DD/YYYY date range and return it as datetimes"""
         try:
             start_dt = datetime.strptime(start_date, '%m/%d/%Y')
             end_dt = datetime.strptime(end_date, '%m/%d/%Y')
@@ -69,35 +238,124 @@ class ScraperInterface:
         
         if start_dt > end_dt:
             raise ValueError("Start date must be before or equal to end date")
-        
-        soup = self.fetch_soup(self.CITY_COUNCIL_PAGE)
+        return start_dt, end_dt
+
+    def filter_meetings_in_range(self, rows, start_dt, end_dt):
+        """Keep calendar rows whose date falls within [start_dt, end_dt], sorted by date"""
         matches = []
+        for date_str, time_text, detail_url in rows:
+            try:
+                meeting_dt = datetime.strptime(date_str, '%m/%d/%Y')
+            except ValueError:
+                # Skip rows with invalid date formats
+                continue
+            if start_dt <= meeting_dt <= end_dt:
+                matches.append((meeting_dt, date_str, time_text, detail_url))
         
-        for row in soup.find_all("tr"):
-            cells = row.find_all("td")
-            if len(cells) >= 5:
-                date_str = cells[0].get_text(strip=True)
-                if not date_str:
-                    continue
-                    
+        # Sort by date (stable, so same-day meetings keep page order)
+        matches.sort(key=lambda x: x[0])
+        return [(date_str, time_text, detail_url) for _, date_str, time_text, detail_url in matches]
+
+    def calendar_index(self, refresh=False, url=None):
+        """Return the shared, date-indexed calendar for a department page (default: this body's)"""
+        url = url or self.DEPARTMENT_PAGE
+        if refresh:
+            CALENDAR_CACHE.invalidate(url)
+        def load():
+            with self.timed('calendar_fetch'):
+                # A refresh must reach the server, not the HTTP cache's still-fresh copy
+                html = self.fetch_html(url, revalidate=refresh)
+            with self.timed('parse'):
+                return MeetingCalendar(self.parse_calendar_page(html))
+        return CALENDAR_CACHE.get(url, load, self.calendar_ttl)
+
+    def fetch_meetings_for_date(self, target_date):
+        """Return list of tuples: (date string, time string, full meeting URL)"""
+        return self.calendar_index().on_date(target_date)
+
+    def fetch_meetings_for_date_range(self, start_date, end_date):
+        """Return list of tuples for meetings in date range: (date string, time string, full meeting URL)"""
+        start_dt, end_dt = self.parse_date_range(start_date, end_date)
+        return self.calendar_index().in_range(start_dt, end_dt)
+
+    def discover_meetings(self, start_date, end_date, bodies=None, max_workers=4):
+        """Find meetings in a date range across several bodies in parallel.
+
+        Returns (meetings, stats). meetings is a date-sorted list of dicts
+        {date, time, url, bodies}; a meeting listed on several bodies' calendars
+        (e.g. a joint session) appears once with every body slug in 'bodies'.
+        stats maps each body slug to {name, meetings, seconds, meetings_per_second}
+        or {name, error}.
+        """
+        start_dt, end_dt = self.parse_date_range(start_date, end_date)
+        slugs = list(bodies or self.bodies)
+        for slug in slugs:
+            if slug not in self.bodies:
+                raise ValueError(f"Unknown body '{slug}'")
+
+        def discover(slug):
+            started = time.perf_counter()
+            calendar = self.calendar_index(url=self.bodies[slug]['url'])
+            rows = calendar.in_range(start_dt, end_dt)
+            return slug, rows, time.perf_counter() - started
+
+        meetings = {}
+        stats = {}
+        with ThreadPoolExecutor(max(1, min(max_workers, len(slugs))), thread_name_prefix="body") as pool:
+            futures = [pool.submit(discover, slug) for slug in slugs]
+            for slug, future in zip(slugs, futures):
+                name = self.bodies[slug]['name']
                 try:
-                    # Parse the meeting date
-                    meeting_dt = datetime.strptime(date_str, '%m/%d/%Y')
-                    
-                    # Check if meeting date is within range
-                    if start_dt <= meeting_dt <= end_dt:
-                        time = cells[2].get_text(strip=True)
-                        link_tag = cells[4].find("a", href=True)
-                        if link_tag and "MeetingDetail.aspx" in link_tag["href"]:
-                            detail_url = urljoin(self.BASE_URL, link_tag["href"])
-                            matches.append((date_str, time, detail_url))
-                except ValueError:
-                    # Skip rows with invalid date formats
+                    _, rows, seconds = future.result()
+                except Exception as e:
+                    logging.error("Failed to fetch calendar for %s: %s", name, e)
+                    stats[slug] = {'name': name, 'error': str(e)}
                     continue
-        
-        # Sort by date
-        matches.sort(key=lambda x: datetime.strptime(x[0], '%m/%d/%Y'))
-        return matches
+                stats[slug] = {
+                    'name': name,
+                    'meetings': len(rows),
+                    'seconds': round(seconds, 3),
+                    'meetings_per_second': round(len(rows) / seconds, 1) if seconds else None,
+                }
+                for date, time_text, url in rows:
+                    meeting = meetings.setdefault(self.meeting_key(url), {
+                        'date': date,
+                        'time': time_text,
+                        'url': url,
+                        'bodies': [],
+                    })
+                    meeting['bodies'].append(slug)
+
+        ordered = sorted(meetings.values(), key=lambda m: datetime.strptime(m['date'], '%m/%d/%Y'))
+        return ordered, stats
+
+    def meeting_key(self, url):
+        """Identity of a meeting for de-duplication: its Legistar meeting ID, else the URL"""
+        ids = parse_qs(urlparse(url).query).get('ID')
+        return ids[0] if ids else url
+
+    def meeting_folder_name(self, date, time_text, url=None):
+        """Deterministic folder name for a meeting found on the calendar.
+
+        With url, the Legistar meeting ID is appended, so bodies meeting at the
+        same date and time (body='all') never share a folder.
+        """
+        name = f"{date} {time_text}".replace("/", "-")
+        if url:
+            key = self.meeting_key(url)
+            name += f" ID{key}" if key != url else f" {hashlib.sha1(url.encode()).hexdigest()[:10]}"
+        return self.sanitize_filename(name)
+
+    def meeting_folders(self, meetings, output_root):
+        """Output folder for each (date, time, url) meeting; ValueError if two would share one"""
+        output_root = Path(output_root)
+        folders = [output_root / self.meeting_folder_name(date, time_text, url) for date, time_text, url in meetings]
+        seen = {}
+        for (date, time_text, url), folder in zip(meetings, folders):
+            if folder in seen:
+                raise ValueError(f"Meetings {seen[folder]} and {url} would both be written to {folder}")
+            seen[folder] = url
+        return folders
 
     def infer_filename_with_extension(self, href, default_name, response):
         """Infer proper filename with extension"""
@@ -120,23 +378,149 @@ class ScraperInterface:
 
     def download_file_to_folder(self, href, default_name, folder_path, skip_download=False):
         """Download file to specified folder"""
+        record = self.download_file_record(href, default_name, folder_path, skip_download)
+        return record['filename'] if record else None
+
+    def file_record(self, href, folder_path, filename, size=None, sha256=None):
+        """Manifest record for a file resolved from href into folder_path"""
+        if size is None and (folder_path / filename).exists():
+            size = (folder_path / filename).stat().st_size
+        return {
+            'url': href,
+            'filename': filename,
+            'size': size,
+            'sha256': sha256,
+            'fetched_at': utc_now(),
+        }
+
+    def download_file_record(self, href, default_name, folder_path, skip_download=False, check_existing=None,
+                             claim=None):
+        """Download file to folder and return its manifest record (url, filename, size, sha256, fetched_at)
+
+        check_existing: HEAD first to find a file already on disk (default: when
+        skip_download is set or the folder holds downloads from an earlier run).
+        claim: maps the filename from the headers to the one to use (see FilenameClaims).
+        """
+        claim = claim or (lambda filename: filename)
+        cache = self.transport.cache
+        if cache is not None:
+            # Fresh cached headers resolve the filename with no request at all
+            entry, fresh = cache.lookup(href, need_body=False)
+            if fresh:
+                filename = claim(self.infer_filename_with_extension(href, default_name, CachedResponse(href, entry['headers'])))
+                if (folder_path / filename).exists() or skip_download:
+                    logging.debug("Skipping cached file: %s", filename)
+                    scrape_metrics.count('cache_hits')
+                    return self.file_record(href, folder_path, filename)
+        
+        # Re-scrapes: a HEAD names the file, so one already on disk costs no body transfer
+        if check_existing is None:
+            check_existing = skip_download or self.has_downloads(folder_path)
+        if check_existing:
+            headers = self.head_headers(href)
+            if headers is not None:
+                if cache is not None:
+                    cache.store(href, headers)
+                filename = claim(self.infer_filename_with_extension(href, default_name, CachedResponse(href, headers)))
+                if (folder_path / filename).exists() or skip_download:
+                    logging.debug("Skipping existing file: %s", filename)
+                    return self.file_record(href, folder_path, filename)
+        
+        attempt = 0
+        while True:
+            body_started = False
+            try:
+                # Stream so only the headers are read until we know the body is needed
+                with self.transport.get(href, stream=True) as response:
+                    body_started = True
+                    response.raise_for_status()
+                    if cache is not None:
+                        cache.store(href, response.headers)
+                    filename = claim(self.infer_filename_with_extension(href, default_name, response))
+                    full_path = folder_path / filename
+                    
+                    if full_path.exists() or skip_download:
+                        logging.debug("Not fetching %s file: %s", "existing" if full_path.exists() else "disabled", filename)
+                        self.release_response(response)
+                        return self.file_record(href, folder_path, filename)
+                    
+                    logging.debug("Downloading file: %s", filename)
+                    size, sha256 = self.stream_response_to_file(response, full_path)
+                    return self.file_record(href, folder_path, filename, size, sha256)
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                # The transport already retried the request itself; this covers a body cut off mid-stream
+                if not body_started or attempt >= self.transport.max_retries:
+                    logging.error("Failed to download file from %s: %s", href, e)
+                    return None
+                delay = self.transport.backoff_delay(attempt)
+                self.transport.record_retry(href, delay, type(e).__name__)
+                time.sleep(delay)
+                attempt += 1
+            except Exception as e:
+                logging.error("Failed to download file from %s: %s", href, e)
+                return None
+
+    def has_downloads(self, folder_path):
+        """True if folder_path holds files besides the scraper's own markdown and manifest,
+        i.e. downloads from an earlier run"""
         try:
-            response = requests.get(href)
-            response.raise_for_status()
-            filename = self.infer_filename_with_extension(href, default_name, response)
-            full_path = folder_path / filename
-            
-            if full_path.exists():
-                logging.debug(f"Skipping existing file: {filename}")
-                return filename
-            else:
-                logging.debug(f"Downloading file: {filename}")
-                if not skip_download:
-                    full_path.write_bytes(response.content)
-                return filename
-        except Exception as e:
-            logging.error(f"Failed to download file from {href}: {e}")
+            with os.scandir(folder_path) as entries:
+                return any(
+                    entry.is_file() and not entry.name.startswith('.')
+                    and not entry.name.endswith('.md') and entry.name != MANIFEST_NAME
+                    for entry in entries
+                )
+        except OSError:
+            return False
+
+    def head_headers(self, href):
+        """Headers of a HEAD for href, or None when the server won't say what a GET would send
+        (HEAD unsupported, an error status, or no Content-Length)"""
+        try:
+            response = self.transport.head(href)
+        except requests.RequestException as e:
+            logging.debug("HEAD failed for %s: %s", href, e)
+            return None
+        if response.status_code in (405, 501) or not response.ok or 'Content-Length' not in response.headers:
             return None
+        return response.headers
+
+    def release_response(self, response, limit=64 * 1024):
+        """Finish reading a small unread body so its connection goes back to the pool;
+        larger bodies are dropped with their connection"""
+        length = response.headers.get('Content-Length')
+        if length is not None and length.isdigit() and int(length) <= limit:
+            for _ in response.iter_content(chunk_size=limit):
+                pass
+
+    def stream_response_to_file(self, response, full_path):
+        """Stream a response body to a temp file in chunks, then atomically rename it into place.
+
+        Returns (size, sha256) of the written file.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=full_path.parent, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if chunk:
+                        tmp.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                        self.report_progress('bytes', count=len(chunk), filename=full_path.name)
+            # mkstemp creates 0600 files; match what write_bytes used to produce
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, full_path)
+            scrape_metrics.count('bytes_downloaded', size, self.timings)
+            return size, digest.hexdigest()
+        except BaseException:
+            # Never leave a partial file behind
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
 
     def extract_meeting_extras(self, soup):
         """Extract meeting extras like agenda and minutes"""
@@ -166,23 +550,67 @@ class ScraperInterface:
                     link_text = a.text.strip()
                     href = urljoin(self.BASE_URL, a.get("href", "")) if a.get("href") else ""
                     extras.append((label, link_text, href))
-                    logging.debug(f"Extra: {label} — {link_text}")
+                    logging.debug("Extra: %s — %s", label, link_text)
             i += 2
             
         return extras
 
-    def download_meeting_extras(self, dest, extras, skip_download=False):
-        """Download meeting extra documents"""
-        downloaded_files = []
+    def download_records(self, downloads, folder_path, skip_download=False, executor=None):
+        """Download (href, default_name) pairs into folder, optionally in parallel.
+
+        Returned records keep the order of ``downloads``; failed downloads are dropped.
+        """
+        # Decided before the batch starts, so this run's own downloads don't count as earlier ones
+        check_existing = skip_download or self.has_downloads(folder_path)
+        # Attachments whose headers name the same file get distinct files, never a shared one
+        claims = FilenameClaims()
+        def fetch(position, href, default_name):
+            try:
+                with self.timed('attachment_download'):
+                    record = self.download_file_record(
+                        href, default_name, folder_path, skip_download, check_existing,
+                        claim=lambda filename: claims.claim(position, filename),
+                    )
+            finally:
+                claims.release(position)
+            self.report_progress(
+                'file_done', url=href,
+                filename=record['filename'] if record else None,
+                size=record['size'] if record else None,
+                failed=record is None,
+            )
+            return record
+        
+        if executor is None:
+            results = [fetch(i, href, default_name) for i, (href, default_name) in enumerate(downloads)]
+        else:
+            # propagate: pool threads report to the meeting that queued the download.
+            # Submitted in order, so every download a claim waits for has already started
+            futures = [
+                executor.submit(scrape_metrics.propagate(fetch), i, href, default_name)
+                for i, (href, default_name) in enumerate(downloads)
+            ]
+            results = [future.result() for future in futures]
+        return [record for record in results if record]
+
+    def download_files(self, downloads, folder_path, skip_download=False, executor=None):
+        """Download (href, default_name) pairs into folder and return the filenames, in order"""
+        records = self.download_records(downloads, folder_path, skip_download, executor)
+        return [record['filename'] for record in records]
+
+    def extra_downloads(self, extras):
+        """Map parsed meeting extras to (href, default filename) download pairs"""
+        downloads = []
         for i, (label, text, href) in enumerate(extras, 1):
             if href == "":
-                logging.debug(f"Skipping extra: {text} (No Link)")
+                logging.debug("Skipping extra: %s (No Link)", text)
                 continue
-            default_filename = f"Extra{i:02d} - {text}"
-            filename = self.download_file_to_folder(href, default_filename, dest, skip_download)
-            if filename:
-                downloaded_files.append(filename)
-        return downloaded_files
+            downloads.append((href, f"Extra{i:02d} - {text}"))
+        return downloads
+
+    def download_meeting_extras(self, dest, extras, skip_download=False, executor=None):
+        """Download meeting extra documents"""
+        return self.download_files(self.extra_downloads(extras), dest, skip_download, executor)
 
     def parse_meeting_header(self, soup, meeting_url):
         """Parse meeting header information"""
@@ -195,7 +623,7 @@ class ScraperInterface:
         meeting_time = time_span.text.strip() if time_span else "Not Found"
         
         meeting_dt = f"{meeting_date} {meeting_time}"
-        logging.debug(f"Meeting date/time: {meeting_dt}")
+        logging.debug("Meeting date/time: %s", meeting_dt)
 
         # Extract extras
         extras = self.extract_meeting_extras(soup)
@@ -213,10 +641,22 @@ class ScraperInterface:
                     if href:
                         url = urljoin(self.BASE_URL, href['href'])
                         items.append((i, subj, url))
-                        logging.debug(f"Item{i}: {subj}")
+                        logging.debug("Item%s: %s", i, subj)
 
         return title, meeting_dt, extras, items
 
+    def extend_past_meeting_ttl(self, meeting_url, meeting_dt):
+        """Keep pages of meetings past their grace period in the HTTP cache much longer;
+        more recent ones keep the normal TTL while minutes and late attachments appear"""
+        if self.transport.cache is None:
+            return
+        try:
+            meeting_date = datetime.strptime(meeting_dt.split()[0], '%m/%d/%Y')
+        except (ValueError, IndexError):
+            return
+        if meeting_date + timedelta(seconds=PAST_MEETING_GRACE) < datetime.now():
+            self.transport.cache.set_ttl(meeting_url, PAST_MEETING_TTL)
+
     def write_meeting_header(self, output_folder, title, meeting_dt, extras, items):
         """Write meeting header markdown file"""
         lines = [
@@ -240,10 +680,8 @@ class ScraperInterface:
         path = output_folder / "AgendaHeader.md"
         path.write_text("\n".join(lines), encoding="utf-8")
 
-    def process_agenda_item(self, index, subj, url, base_folder, selection=None, skip_download=False):
-        """Process individual agenda item"""
-        soup = self.fetch_soup(url)
-
+    def parse_agenda_item(self, soup):
+        """Parse a LegislationDetail page into (item date/time, description, [(text, url)] attachments)"""
         # Get item date/time
         dt_span = soup.find("span", id=re.compile(r"lblOnAgenda2", re.IGNORECASE))
         item_dt = dt_span.text.strip() if dt_span else "Not Found"
@@ -251,6 +689,17 @@ class ScraperInterface:
         meta = soup.find("meta", {"name": "description"})
         desc = meta["content"].strip() if meta else ""
 
+        attachments = []
+        for a in soup.select("a[href*='View.ashx?M=F']"):
+            link = urljoin(self.BASE_URL, a['href'])
+            text = a.text.strip() or f"Attachment{len(attachments)+1}"
+            attachments.append((text, link))
+            logging.debug("Attachment: %s", text)
+        
+        return item_dt, desc, attachments
+
+    def write_agenda_item(self, index, subj, item_dt, desc, attachments, base_folder):
+        """Create the item folder, write its AgendaHeader.md and return the folder"""
         # Create folder name
         words = re.findall(r"\b\w+\b", subj)
         short = " ".join(words[:6])
@@ -268,29 +717,47 @@ class ScraperInterface:
             "## Attachments",
             ""
         ]
-        
-        attachments = []
-        downloaded_files = []
-        
-        for a in soup.select("a[href*='View.ashx?M=F']"):
-            link = urljoin(self.BASE_URL, a['href'])
-            text = a.text.strip() or f"Attachment{len(attachments)+1}"
-            attachments.append((text, link))
+        for text, link in attachments:
             lines.append(f"- [{text}]({link})")
-            logging.debug(f"Attachment: {text}")
 
         # Write agenda header
         (folder / "AgendaHeader.md").write_text("\n".join(lines), encoding="utf-8")
+        return folder
+
+    def attachment_downloads(self, attachments):
+        """Map parsed attachments to (href, default filename) download pairs"""
+        return [
+            (href, f"Attachment{idx:02d} - {text}")
+            for idx, (text, href) in enumerate(attachments, 1)
+        ]
+
+    def process_agenda_item(self, index, subj, url, base_folder, selection=None, skip_download=False, executor=None):
+        """Process individual agenda item"""
+        entry = self.process_agenda_item_entry(index, subj, url, base_folder, skip_download, executor)
+        return [record['filename'] for record in entry['attachments']]
+
+    def process_agenda_item_entry(self, index, subj, url, base_folder, skip_download=False, executor=None, html=None):
+        """Process an agenda item and return its manifest entry (html: its page, if already fetched)"""
+        if html is None:
+            with self.timed('item_fetch'):
+                html = self.fetch_html(url)
+        with self.timed('parse'):
+            item_dt, desc, attachments = self.parse_agenda_item_page(html)
+        folder = self.write_agenda_item(index, subj, item_dt, desc, attachments, base_folder)
 
         # Download attachments
-        for idx, (text, href) in enumerate(attachments, 1):
-            default_filename = f"Attachment{idx:02d} - {text}"
-            filename = self.download_file_to_folder(href, default_filename, folder, skip_download)
-            if filename:
-                downloaded_files.append(filename)
+        downloads = self.attachment_downloads(attachments)
+        records = self.download_records(downloads, folder, skip_download, executor)
 
-        logging.debug(f"Finished processing Item {index}: downloaded {len(downloaded_files)} attachments")
-        return downloaded_files
+        logging.debug("Finished processing Item %s: downloaded %s attachments", index, len(records))
+        return {
+            'index': index,
+            'subject': subj,
+            'url': url,
+            'folder': folder.name,
+            'attachments': records,
+            'fetched_at': utc_now(),
+        }
 
     def parse_item_numbers(self, selection):
         """Parse item number selection"""
@@ -306,65 +773,269 @@ class ScraperInterface:
                 selected.add(int(token))
         return selected
 
+    def check_cancelled(self, params):
+        """Stop the current scrape if its cancel event (set by the app's task queue) has fired"""
+        cancel_event = params.get('cancel_event')
+        if cancel_event is not None and cancel_event.is_set():
+            raise ScrapeCancelled("Scrape cancelled")
+
     def process_meeting(self, meeting_url, dest, params):
-        """Process a complete meeting"""
+        """Process a complete meeting.
+
+        result['timings'] breaks the meeting down by phase (seconds and calls,
+        summed over worker threads, so they can exceed wall_seconds) and counts
+        its requests, retries, cache hits and bytes.
+        """
+        start = time.perf_counter()
+        with scrape_metrics.collect(scrape_metrics.PhaseTimings()) as timings:
+            result = self._process_meeting(meeting_url, dest, params)
+        result['timings'] = dict(timings.summary(), wall_seconds=round(time.perf_counter() - start, 3))
+        return result
+
+    def _process_meeting(self, meeting_url, dest, params):
         import shutil
         
+        self.check_cancelled(params)
         dest = Path(dest)
         
         # Remove existing folder if requested
         if params.get('remove_output') and dest.exists():
-            logging.debug(f"Removing existing folder: {dest}")
+            logging.debug("Removing existing folder: %s", dest)
             shutil.rmtree(dest)
             
         dest.mkdir(parents=True, exist_ok=True)
-        logging.debug(f"Output folder: {dest}")
+        logging.debug("Output folder: %s", dest)
         
-        # Fetch meeting page
-        soup = self.fetch_soup(meeting_url)
+        # Fetch meeting page; a re-sync must see the live agenda, not a cached copy
+        with self.timed('meeting_fetch'):
+            html = self.fetch_html(meeting_url, revalidate=bool(params.get('resync')))
         
         # Parse meeting information
-        title, meeting_dt, extras, items = self.parse_meeting_header(soup, meeting_url)
+        with self.timed('parse'):
+            title, meeting_dt, extras, items = self.parse_meeting_page(html, meeting_url)
+        self.extend_past_meeting_ttl(meeting_url, meeting_dt)
         
         # Write meeting header
         self.write_meeting_header(dest, title, meeting_dt, extras, items)
         
-        # Download meeting extras
         skip_download = params.get('skip_download', False)
-        extra_files = self.download_meeting_extras(dest, extras, skip_download)
+        plan = self.resync_plan(dest, items, extras, params)
+        candidates = plan['candidates']
+        previous_items = plan['previous_items']
+        
+        def run_item(item, download_pool=None):
+            """(manifest entry, True if it was fetched rather than reused)"""
+            idx, subj, url = item
+            self.check_cancelled(params)
+            html = None
+            old = candidates.get(idx)
+            if old is not None:
+                with self.timed('item_fetch'):
+                    html = self.fetch_html(url, revalidate=True)
+                with self.timed('parse'):
+                    attachments = self.parse_agenda_item_page(html)[2]
+                if self.attachments_unchanged(attachments, old):
+                    logging.debug("Unchanged Item %s: %s", idx, subj)
+                    self.report_progress('item_done', url=meeting_url, index=idx, subject=subj)
+                    return old, False
+            logging.debug("Processing Item%s: %s", idx, subj)
+            entry = self.process_agenda_item_entry(idx, subj, url, dest, skip_download, download_pool, html=html)
+            old = previous_items.get(idx)
+            merge_hashes(entry['attachments'], old['attachments'] if old else None)
+            self.report_progress('item_done', url=meeting_url, index=idx, subject=subj)
+            return entry, True
+        
+        work, extra_work = plan['work'], plan['extra_work']
+        self.report_progress(
+            'meeting_started', url=meeting_url, title=title,
+            items_total=len(work), files_total=len(extra_work),
+        )
+        
+        # max_workers > 1 fans item pages and attachment downloads out over two
+        # thread pools; separate pools keep item tasks from starving on their own downloads
+        max_workers = max(1, int(params.get('max_workers') or 1))
+        if max_workers == 1:
+            extra_records = self.download_records(extra_work, dest, skip_download)
+            outcomes = [run_item(item) for item in work]
+        else:
+            logging.debug("Processing %s items with %s workers", len(work), max_workers)
+            with ThreadPoolExecutor(max_workers, thread_name_prefix="item") as item_pool, \
+                    ThreadPoolExecutor(max_workers, thread_name_prefix="download") as download_pool:
+                extras_future = item_pool.submit(
+                    scrape_metrics.propagate(self.download_records), extra_work, dest, skip_download, download_pool
+                )
+                # map() yields results in submission order, so processed_items stays ordered
+                outcomes = list(item_pool.map(scrape_metrics.propagate(lambda item: run_item(item, download_pool)), work))
+                extra_records = extras_future.result()
         
-        # Process agenda items
+        result = self.meeting_result(meeting_url, dest, title, meeting_dt, extras, items, plan, outcomes, extra_records)
+        # Nothing new on a re-sync means nothing new to split
+        self.finish_meeting(dest, result, params, changed=bool(result['items_fetched'] or extra_records) or not plan['resync'])
+        logging.debug("Meeting processing completed")
+        return result
+
+    def resync_plan(self, dest, items, extras, params):
+        """Split a meeting's items and extras into work to do and manifest entries to keep.
+
+        Returns a dict: work/extra_work to process; candidates, items that may be
+        reused if their page still lists the same attachments (see
+        attachments_unchanged); reused_extras and carried entries kept as they
+        are; previous_items/previous_extras from the last manifest.
+        """
         selected_items = self.parse_item_numbers(params.get('selection'))
-        processed_items = []
+        # Re-sync: reuse manifest entries whose URL/subject are unchanged and whose files are still on disk
+        manifest = load_manifest(dest)
+        previous = manifest if params.get('resync') else None
+        previous_items = {item['index']: item for item in (previous or {}).get('items', [])}
+        previous_extras = {record['url']: record for record in (previous or {}).get('extras', [])}
+        # Items left out of a selection keep their earlier manifest entries while
+        # they are still on the agenda unchanged and their folder still exists
+        manifest_items = {item['index']: item for item in (manifest or {}).get('items', [])}
+        carried = {}
         
+        work = []
+        candidates = {}
         for idx, subj, url in items:
-            if selected_items is None or idx in selected_items:
-                logging.debug(f"Processing Item{idx}: {subj}")
-                item_files = self.process_agenda_item(idx, subj, url, dest, selected_items, skip_download)
-                processed_items.append({
-                    'index': idx,
-                    'subject': subj,
-                    'files': item_files
-                })
+            if selected_items is not None and idx not in selected_items:
+                old = manifest_items.get(idx)
+                if old and old['url'] == url and old['subject'] == subj and (dest / old['folder']).is_dir():
+                    carried[idx] = old
+                logging.debug("Skipping Item %s: %s", idx, subj)
+            else:
+                old = previous_items.get(idx)
+                if old and old['url'] == url and old['subject'] == subj \
+                        and (dest / old['folder']).is_dir() and files_present(dest / old['folder'], old['attachments']):
+                    # Reused if its page (revalidated) still lists the same attachments
+                    candidates[idx] = old
+                work.append((idx, subj, url))
+        
+        extra_work = []
+        reused_extras = {}
+        for href, default_name in self.extra_downloads(extras):
+            old = previous_extras.get(href)
+            if old and files_present(dest, [old]):
+                reused_extras[href] = old
             else:
-                logging.debug(f"Skipping Item {idx}: {subj}")
+                extra_work.append((href, default_name))
+        
+        return {
+            'resync': previous is not None,
+            'work': work,
+            'candidates': candidates,
+            'carried': carried,
+            'extra_work': extra_work,
+            'reused_extras': reused_extras,
+            'previous_items': previous_items,
+            'previous_extras': previous_extras,
+        }
+
+    def attachments_unchanged(self, attachments, old):
+        """True if an item page's parsed attachments are the ones its manifest entry recorded"""
+        return [href for href, _ in self.attachment_downloads(attachments)] == [r['url'] for r in old['attachments']]
+
+    def meeting_result(self, meeting_url, dest, title, meeting_dt, extras, items, plan, outcomes, extra_records):
+        """Save the meeting's manifest and return its result dict.
+
+        outcomes holds a (manifest entry, was fetched) pair per item of plan['work'].
+        """
+        merge_hashes(extra_records, plan['previous_extras'].values())
+        fetched = [entry for entry, was_fetched in outcomes if was_fetched]
+        reused = {entry['index']: entry for entry, was_fetched in outcomes if not was_fetched}
+        carried, reused_extras = plan['carried'], plan['reused_extras']
         
-        result = {
+        # Reassemble in agenda / extras order
+        fetched_by_index = {entry['index']: entry for entry in fetched}
+        item_entries = [
+            reused.get(idx) or fetched_by_index[idx]
+            for idx, subj, url in items if idx in reused or idx in fetched_by_index
+        ]
+        manifest_entries = [
+            reused.get(idx) or fetched_by_index.get(idx) or carried[idx]
+            for idx, subj, url in items if idx in reused or idx in fetched_by_index or idx in carried
+        ]
+        fetched_extras = {record['url']: record for record in extra_records}
+        extra_entries = [
+            reused_extras.get(href) or fetched_extras[href]
+            for href, default_name in self.extra_downloads(extras)
+            if href in reused_extras or href in fetched_extras
+        ]
+        processed_items = [
+            {
+                'index': entry['index'],
+                'subject': entry['subject'],
+                'files': [record['filename'] for record in entry['attachments']]
+            }
+            for entry in item_entries
+        ]
+        extra_files = [record['filename'] for record in extra_entries]
+        
+        save_manifest(dest, {
+            'meeting_url': meeting_url,
+            'title': title,
+            'meeting_dt': meeting_dt,
+            'fetched_at': utc_now(),
+            'extras': extra_entries,
+            'items': manifest_entries,
+        })
+        
+        return {
             'title': title,
             'meeting_dt': meeting_dt,
             'output_folder': str(dest),
             'extras_count': len(extras),
             'items_count': len(items),
             'processed_items': processed_items,
-            'extra_files': extra_files
+            'extra_files': extra_files,
+            'items_fetched': len(fetched),
+            'items_unchanged': len(reused),
         }
-        
+
+    def finish_meeting(self, dest, result, params, changed=True):
+        """Split supplemental reports (unless nothing changed) and update the search index for a processed meeting"""
         # Process supplemental reports if enabled and found
-        if params.get('split_supplemental', True):  # Default True for backward compatibility
-            self.process_supplemental_reports(dest, processed_items)
+        if params.get('split_supplemental', True) and changed:  # Default True for backward compatibility
+            self.check_cancelled(params)
+            with self.timed('supplemental_split'):
+                self.process_supplemental_reports(dest, result['processed_items'])
         
-        logging.debug("Meeting processing completed")
-        return result
+        if self.search_index is not None:
+            # Only files whose size/mtime changed are (re)extracted
+            with self.timed('search_index'):
+                result['search_index'] = self.search_index.index_folder(result['output_folder'])
+
+    def process_meetings(self, meetings, output_root, params, meeting_workers=2, progress_callback=None):
+        """Process many (date, time, url) meetings into output_root/<date time ID>/ with a bounded pool.
+
+        Returns one result per meeting, in input order: the process_meeting result
+        plus date/time/url, or {date, time, url, output_folder, error} on failure.
+        progress_callback(done, total, result) is called as each meeting finishes.
+        """
+        total = len(meetings)
+        done = 0
+        # Checked before anything is submitted: parallel meetings must never share a folder
+        folders = self.meeting_folders(meetings, output_root)
+        
+        def run(meeting, dest):
+            date, time_text, url = meeting
+            try:
+                result = self.process_meeting(url, dest, params)
+            except ScrapeCancelled:
+                raise
+            except Exception as e:
+                logging.error("Failed to process meeting %s: %s", url, e)
+                result = {'output_folder': str(dest), 'error': str(e)}
+            result.update({'date': date, 'time': time_text, 'url': url})
+            return result
+        
+        results = [None] * total
+        with ThreadPoolExecutor(max(1, meeting_workers), thread_name_prefix="meeting") as pool:
+            futures = {pool.submit(run, meeting, dest): i for i, (meeting, dest) in enumerate(zip(meetings, folders))}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, results[futures[future]])
+        return results
 
     def find_supplemental_reports(self, meeting_folder):
         """Find supplemental report PDFs in the meeting folder"""
@@ -378,56 +1049,20 @@ class ScraperInterface:
 
     def split_supplemental_pdf(self, pdf_path, agenda_items):
         """Split supplemental PDF into separate files for each agenda item"""
-        logging.debug(f"Processing supplemental PDF: {pdf_path}")
-        
-        # Patterns to detect headers and subject
-        break_pattern = re.compile(
-            r"CITY COUNCIL STAFF REPORT\s+(DESK ITEM|SUPPLEMENTAL 1)?\s*Meeting: (\w+ \d{1,2}, \d{4})\s+Agenda Item #(\d+)",
-            re.MULTILINE,
-        )
-        subject_pattern = re.compile(r"Subject\s*(.*?)\s*(?=\n|\r|$)", re.DOTALL)
-        
-        def get_subject(text_block):
-            match = subject_pattern.search(text_block)
-            if match:
-                subject_line = match.group(1).strip()
-                return " ".join(subject_line.split()[:6])
-            return "NoSubject"
+        logging.debug("Processing supplemental PDF: %s", pdf_path)
         
         try:
+            # Detect report boundaries (in parallel for large packets); keep only page ranges
+            metadata_list = find_report_ranges(
+                pdf_path, self.split_workers, clip=self.split_header_clip, blocks=self.split_header_blocks,
+                text_cache=self.text_cache,
+            )
+            packet_texts = self.text_cache.get(pdf_path) if self.text_cache is not None else None
             all_docs = fitz.open(pdf_path)
-            current_doc = []
-            metadata_list = []
-            doc_header = {}
-            
-            for idx, page in enumerate(all_docs):
-                text = page.get_text()
-                match = break_pattern.search(text)
-                if match:
-                    if doc_header:
-                        # Save the last doc in metadata_list
-                        metadata_list.append((current_doc, doc_header))
-                    # Start a new doc
-                    current_doc = []
-                    item_type, meeting_date, agenda_num = match.groups()
-                    subject = get_subject(text)
-                    doc_header = {
-                        "type": item_type.strip() if item_type else "Standard",
-                        "date": meeting_date.strip(),
-                        "agenda": f"Agenda Item #{agenda_num}",
-                        "agenda_num": agenda_num,
-                        "subject": subject,
-                    }
-                # Add page to current doc
-                current_doc.append(page)
-            
-            if current_doc:
-                # Save the last doc
-                metadata_list.append((current_doc, doc_header))
             
             split_files = []
             
-            for pages, meta in metadata_list:
+            for first_page, last_page, meta in metadata_list:
                 agenda_num = meta["agenda_num"]
                 
                 # Find or create corresponding agenda item folder
@@ -474,24 +1109,26 @@ class ScraperInterface:
                     filename = self.sanitize_filename(filename) + ".pdf"
                     out_path = target_folder / filename
                     
-                    # Create new PDF with selected pages
+                    # Create new PDF from the report's contiguous page range in one copy
                     new_doc = fitz.open()
-                    for p in pages:
-                        new_doc.insert_pdf(p.parent, from_page=p.number, to_page=p.number)
+                    new_doc.insert_pdf(all_docs, from_page=first_page, to_page=last_page)
                     new_doc.save(out_path)
                     new_doc.close()
+                    if packet_texts is not None:
+                        # Copied pages extract to the same text, so the indexer needn't parse the split file
+                        self.text_cache.put(out_path, packet_texts[first_page:last_page + 1])
                     
                     split_files.append(out_path)
                     print(f"✅ Added supplemental file: {filename} -> {target_folder.name}")
-                    logging.debug(f"✅ Split supplemental: {filename} -> {target_folder.name}")
+                    logging.debug("✅ Split supplemental: %s -> %s", filename, target_folder.name)
                 else:
-                    logging.debug(f"⚠️ Could not create folder for agenda item #{agenda_num}")
+                    logging.debug("⚠️ Could not create folder for agenda item #%s", agenda_num)
             
             all_docs.close()
             return split_files
             
         except Exception as e:
-            logging.error(f"Error splitting supplemental PDF {pdf_path}: {e}")
+            logging.error("Error splitting supplemental PDF %s: %s", pdf_path, e)
             return []
 
     def process_supplemental_reports(self, meeting_folder, processed_items):
@@ -506,12 +1143,12 @@ class ScraperInterface:
         
         for supp_file in supplemental_files:
             print(f"📄 Splitting supplemental report: {supp_file.name}")
-            logging.debug(f"Found supplemental report: {supp_file.name}")
+            logging.debug("Found supplemental report: %s", supp_file.name)
             split_files = self.split_supplemental_pdf(supp_file, processed_items)
             
             if split_files:
                 print(f"✅ Successfully split {supp_file.name} into {len(split_files)} files")
-                logging.debug(f"Successfully split {supp_file.name} into {len(split_files)} files")
+                logging.debug("Successfully split %s into %s files", supp_file.name, len(split_files))
             else:
                 print(f"⚠️ No agenda items found in {supp_file.name}")
-                logging.debug(f"No files were split from {supp_file.name}")
+                logging.debug("No files were split from %s", supp_file.name)
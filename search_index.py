@@ -0,0 +1,218 @@
+"""Incremental SQLite FTS5 index over scraped meeting folders.
+
+Indexes the AgendaHeader.md files (meeting and agenda item headers) and the
+text of every PDF, one row per PDF page, so hits can point at a page. Files
+are re-indexed only when their size or mtime changes.
+
+    python search_index.py OUT_MEETING_FOLDER [more folders...]   # index existing archives
+"""
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from log_setup import configure_logging
+from meeting_manifest import MANIFEST_NAME
+
+INDEXED_SUFFIXES = {'.md', '.pdf'}
+# Snippet highlight markers; control characters never occur in extracted text
+MARK_START, MARK_END = "\x02", "\x03"
+
+
+def pdf_page_texts(path):
+    """Text of every page of a PDF, in page order"""
+    with fitz.open(path) as doc:
+        return [page.get_text() for page in doc]
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix"""
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words[:-1]] + [f'"{words[-1]}"*']
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """FTS5 index of meeting folders; one instance is safe to share between threads"""
+
+    def __init__(self, db_path, text_cache=None):
+        self.db_path = str(db_path)
+        # Optional pdf_text_cache.PdfTextCache; PDFs the splitter already read are not parsed again
+        self.text_cache = text_cache
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                folder TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS documents_folder ON documents (folder);
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY,
+                document_id INTEGER NOT NULL,
+                page INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS pages_document ON pages (document_id);
+            CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(
+                title, body, tokenize = 'porter unicode61'
+            );
+        """)
+        self._db.commit()
+
+    def _extract(self, path):
+        """(title, [page texts]) for an indexable file"""
+        if path.suffix.lower() == '.pdf':
+            if self.text_cache is not None:
+                return path.stem, list(self.text_cache.pages(path))
+            return path.stem, pdf_page_texts(path)
+        text = path.read_text(encoding='utf-8', errors='replace')
+        first_line = text.split("\n", 1)[0].lstrip("# ").strip()
+        return first_line or path.parent.name, [text]
+
+    def _remove(self, document_id):
+        page_ids = [row[0] for row in self._db.execute("SELECT id FROM pages WHERE document_id = ?", (document_id,))]
+        self._db.executemany("DELETE FROM page_text WHERE rowid = ?", [(page_id,) for page_id in page_ids])
+        self._db.execute("DELETE FROM pages WHERE document_id = ?", (document_id,))
+        self._db.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+
+    def index_file(self, path, folder):
+        """Index one file under folder: returns 'indexed', 'unchanged' or 'failed'.
+
+        Unreadable files are recorded with no text, so they aren't retried until they change.
+        """
+        path = Path(path)
+        st = path.stat()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size, mtime_ns FROM documents WHERE path = ?", (str(path),)
+            ).fetchone()
+        if row == (st.st_size, st.st_mtime_ns):
+            return 'unchanged'
+        # Extract outside the lock so meetings processed in parallel don't queue on PDF parsing
+        status = 'indexed'
+        try:
+            title, texts = self._extract(path)
+        except Exception as e:
+            logging.warning("Could not index %s: %s", path, e)
+            title, texts, status = path.name, [], 'failed'
+        with self._lock:
+            old = self._db.execute("SELECT id FROM documents WHERE path = ?", (str(path),)).fetchone()
+            if old:
+                self._remove(old[0])
+            document_id = self._db.execute(
+                "INSERT INTO documents (path, folder, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                (str(path), str(folder), st.st_size, st.st_mtime_ns),
+            ).lastrowid
+            for page_no, text in enumerate(texts):
+                page_id = self._db.execute(
+                    "INSERT INTO pages (document_id, page) VALUES (?, ?)", (document_id, page_no)
+                ).lastrowid
+                self._db.execute("INSERT INTO page_text (rowid, title, body) VALUES (?, ?, ?)", (page_id, title, text))
+            self._db.commit()
+        return status
+
+    def index_folder(self, folder):
+        """Bring the index up to date with a meeting folder: add/refresh changed files, drop deleted ones.
+
+        A meeting scraped straight into an archive root shares it with other
+        meetings' folders; subfolders holding their own manifest are other
+        meetings and are not walked. Returns counts of indexed, unchanged,
+        removed and failed files.
+        """
+        folder = Path(folder)
+        stats = {'indexed': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+        seen = set()
+        nested = []
+        for root, dirs, files in os.walk(folder):
+            meetings = [name for name in dirs if (Path(root) / name / MANIFEST_NAME).exists()]
+            if meetings:
+                nested += [os.path.join(root, name) + os.sep for name in meetings]
+                dirs[:] = [name for name in dirs if name not in meetings]
+            for name in files:
+                path = Path(root) / name
+                if name.startswith('.') or path.suffix.lower() not in INDEXED_SUFFIXES:
+                    continue
+                seen.add(str(path))
+                try:
+                    stats[self.index_file(path, folder)] += 1
+                except OSError as e:
+                    # Removed or unreadable mid-walk; the rest of the meeting still gets indexed
+                    logging.warning("Could not index %s: %s", path, e)
+                    stats['failed'] += 1
+        with self._lock:
+            stale = [
+                (document_id, path)
+                for document_id, path in self._db.execute(
+                    "SELECT id, path FROM documents WHERE folder = ?", (str(folder),)
+                )
+                if path not in seen and not path.startswith(tuple(nested))
+            ]
+            for document_id, path in stale:
+                self._remove(document_id)
+            self._db.commit()
+        stats['removed'] = len(stale)
+        logging.debug("Search index update for %s: %s", folder, stats)
+        return stats
+
+    def search(self, text, limit=20, offset=0):
+        """Ranked hits for free text: [{path, folder, page, title, snippet, score}], best first.
+
+        Snippets mark matched terms with MARK_START/MARK_END.
+        """
+        query = fts_query(text)
+        if query is None:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                f"""
+                SELECT documents.path, documents.folder, pages.page, page_text.title,
+                       snippet(page_text, 1, '{MARK_START}', '{MARK_END}', '…', 16),
+                       bm25(page_text, 5.0, 1.0) AS score
+                FROM page_text
+                JOIN pages ON pages.id = page_text.rowid
+                JOIN documents ON documents.id = pages.document_id
+                WHERE page_text MATCH ?
+                ORDER BY score
+                LIMIT ? OFFSET ?
+                """,
+                (query, limit, offset),
+            ).fetchall()
+        return [
+            {'path': path, 'folder': folder, 'page': page + 1, 'title': title, 'snippet': snippet, 'score': score}
+            for path, folder, page, title, snippet, score in rows
+        ]
+
+    def stats(self):
+        """Number of indexed documents and pages"""
+        with self._lock:
+            documents = self._db.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            pages = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {'documents': documents, 'pages': pages}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    index = SearchIndex(os.environ.get("SCRAPER_SEARCH_DB", "search_index.sqlite3"))
+    for root in sys.argv[1:] or ["OUT_MEETING_FOLDER"]:
+        # Each meeting is its own folder holding an AgendaHeader.md
+        for header in sorted(Path(root).glob("**/AgendaHeader.md")):
+            meeting = header.parent
+            if (meeting / MANIFEST_NAME).exists() or not any((parent / "AgendaHeader.md").exists() for parent in meeting.parents):
+                logging.info("%s: %s", meeting, index.index_folder(meeting))
+    logging.info("Index: %s", index.stats())
+    index.close()
@@ -0,0 +1,211 @@
+"""Boundary detection for supplemental staff-report packets.
+
+Kept free of the scraper's heavier imports so worker processes start quickly.
+"""
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+import fitz  # PyMuPDF
+
+from pdf_text_cache import extract_page_texts
+
+# Patterns to detect headers and subject
+BREAK_PATTERN = re.compile(
+    r"CITY COUNCIL STAFF REPORT\s+(DESK ITEM|SUPPLEMENTAL 1)?\s*Meeting: (\w+ \d{1,2}, \d{4})\s+Agenda Item #(\d+)",
+    re.MULTILINE,
+)
+SUBJECT_PATTERN = re.compile(r"Subject\s*(.*?)\s*(?=\n|\r|$)", re.DOTALL)
+
+# Fewest pages worth handing to a worker process; smaller documents are scanned in-process
+CHUNK_MIN_PAGES = 32
+
+# One spawn pool for the whole process, started on first use and sized to the CPU count
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_subject(text_block):
+    """First six words of the report's Subject line"""
+    match = SUBJECT_PATTERN.search(text_block)
+    if match:
+        subject_line = match.group(1).strip()
+        return " ".join(subject_line.split()[:6])
+    return "NoSubject"
+
+
+def header_text(page, clip=None, blocks=None):
+    """Text of the part of a page where a report header can appear.
+
+    ``clip`` is the fraction of the page height, from the top, to read;
+    ``blocks`` keeps only the first N text blocks (within the clip, if any).
+    With neither set, this is the full page text.
+
+    Only ``clip`` reliably saves time. ``blocks`` still lays out every block
+    in its region, so on its own it is slower than full-page text (about 0.9x
+    in benchmarks/split_header_scan.py) and adds nothing consistent on top of
+    ``clip``.
+    """
+    rect = None
+    if clip:
+        rect = fitz.Rect(page.rect.x0, page.rect.y0, page.rect.x1, page.rect.y0 + page.rect.height * clip)
+    if blocks:
+        text_blocks = [b for b in page.get_text("blocks", clip=rect) if b[6] == 0]
+        return "\n".join(b[4] for b in text_blocks[:blocks])
+    return page.get_text(clip=rect)
+
+
+def header_from_match(match, text):
+    """Header dict for a BREAK_PATTERN match; text is the full page text (for the subject)"""
+    item_type, meeting_date, agenda_num = match.groups()
+    return {
+        "type": item_type.strip() if item_type else "Standard",
+        "date": meeting_date.strip(),
+        "agenda": f"Agenda Item #{agenda_num}",
+        "agenda_num": agenda_num,
+        "subject": get_subject(text),
+    }
+
+
+def scan_pages(pdf_path, start, stop, clip=None, blocks=None):
+    """Return (page number, header dict) for each report header found in pages [start, stop)"""
+    headers = []
+    with fitz.open(pdf_path) as doc:
+        for page_no in range(start, stop):
+            page = doc[page_no]
+            text = header_text(page, clip, blocks)
+            match = BREAK_PATTERN.search(text)
+            if match:
+                if clip or blocks:
+                    # The Subject line can sit below the header region
+                    text = page.get_text()
+                headers.append((page_no, header_from_match(match, text)))
+    return headers
+
+
+def header_texts(pdf_path, start, stop, clip=None, blocks=None):
+    """header_text of each page in [start, stop)"""
+    with fitz.open(pdf_path) as doc:
+        return [header_text(doc[page_no], clip, blocks) for page_no in range(start, stop)]
+
+
+def header_variant(clip=None, blocks=None):
+    """PdfTextCache variant name for header_text(clip, blocks); None for full page text"""
+    if not (clip or blocks):
+        return None
+    return f"header-clip{clip or 0:g}-blocks{blocks or 0}"
+
+
+def scan_texts(texts, full_text=None):
+    """(page number, header dict) for each report header in a sequence of page texts.
+
+    texts may be header-region texts (see header_text); full_text(page_no)
+    then supplies a matched page's full text, where its Subject line is.
+    """
+    headers = []
+    for page_no, text in enumerate(texts):
+        match = BREAK_PATTERN.search(text)
+        if match:
+            headers.append((page_no, header_from_match(match, full_text(page_no) if full_text else text)))
+    return headers
+
+
+def _scan_chunk(args):
+    return scan_pages(*args)
+
+
+def _header_chunk(args):
+    return header_texts(*args)
+
+
+def _extract_chunk(args):
+    return extract_page_texts(*args)
+
+
+def _scan_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: the caller may be a threaded web worker, where fork is unsafe.
+            # Workers start on demand and stay up for later documents.
+            _pool = ProcessPoolExecutor(os.cpu_count() or 1, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _map_chunks(pdf_path, page_count, workers, fn, *extra):
+    """Concatenated results of fn over contiguous page chunks, on the shared process pool when worthwhile"""
+    workers = min(workers, os.cpu_count() or 1, page_count // CHUNK_MIN_PAGES)
+    if workers > 1:
+        chunk = -(-page_count // workers)
+        chunks = [(str(pdf_path), start, min(start + chunk, page_count), *extra) for start in range(0, page_count, chunk)]
+        pool = _scan_pool()
+        try:
+            return [result for part in pool.map(fn, chunks) for result in part]
+        except BrokenProcessPool as e:
+            logging.warning("Parallel scan of %s failed (%s); scanning serially", pdf_path, e)
+            _discard_pool(pool)
+    return fn((str(pdf_path), 0, page_count, *extra))
+
+
+def fitz_page_count(pdf_path):
+    with fitz.open(pdf_path) as doc:
+        return doc.page_count
+
+
+def page_texts(pdf_path, workers=None):
+    """Full text of every page, extracted over ``workers`` processes for large documents"""
+    return _map_chunks(pdf_path, fitz_page_count(pdf_path), workers or os.cpu_count() or 1, _extract_chunk)
+
+
+def find_report_ranges(pdf_path, workers=None, clip=None, blocks=None, text_cache=None):
+    """Split a packet into reports: [(first page, last page, header dict)], in page order.
+
+    Pages before the first header belong to no report and are dropped. Text
+    extraction is spread over ``workers`` processes in contiguous page chunks;
+    only page numbers and header metadata come back, never fitz Page objects.
+    ``clip``/``blocks`` limit boundary detection to the top of each page (see
+    header_text); full text is then read only for pages that start a report.
+
+    With a ``text_cache`` (pdf_text_cache.PdfTextCache) the text scanned for
+    headers (full page, or the clip/blocks header region) is extracted once per
+    unique document and reused by later runs; the results are the same as
+    without the cache.
+    """
+    workers = workers or os.cpu_count() or 1
+    if text_cache is not None and (clip or blocks):
+        texts = text_cache.pages(
+            pdf_path,
+            extract=lambda path: _map_chunks(path, fitz_page_count(path), workers, _header_chunk, clip, blocks),
+            variant=header_variant(clip, blocks),
+        )
+        page_count = len(texts)
+        full = text_cache.get(pdf_path)
+        with fitz.open(pdf_path) as doc:
+            # Subjects come from the full text of matched pages only
+            headers = scan_texts(texts, full.__getitem__ if full is not None else lambda n: doc[n].get_text())
+    elif text_cache is not None:
+        texts = text_cache.pages(pdf_path, extract=lambda path: page_texts(path, workers))
+        page_count = len(texts)
+        headers = scan_texts(texts)
+    else:
+        with fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+        headers = _map_chunks(pdf_path, page_count, workers, _scan_chunk, clip, blocks)
+
+    ranges = []
+    for i, (page_no, header) in enumerate(headers):
+        last = headers[i + 1][0] - 1 if i + 1 < len(headers) else page_count - 1
+        ranges.append((page_no, last, header))
+    return ranges
@@ -0,0 +1,105 @@
+import heapq
+import itertools
+import logging
+import threading
+
+
+class QueueFull(Exception):
+    """Raised by TaskQueue.submit when max_queued tasks are already waiting"""
+
+
+class TaskQueue:
+    """Bounded pool of worker threads running submitted tasks by priority, then FIFO.
+
+    Lower priority numbers run first; equal priorities run in submission order.
+    Each task is called as fn(*args, cancel_event=event); cancel() removes a
+    waiting task outright and sets the event of a running one, which the task
+    is expected to check (ScraperInterface does so through params['cancel_event']).
+    """
+
+    def __init__(self, workers=2, max_queued=50):
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self._cond = threading.Condition()
+        self._heap = []                 # (priority, seq, task_id)
+        self._queued = {}               # task_id -> (fn, args)
+        self._running = {}              # task_id -> cancel event
+        self._seq = itertools.count()
+        self._threads = []
+
+    def _start_workers(self):
+        # Started lazily so importing the app (e.g. in a gunicorn master) spawns no threads
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"task-worker-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, task_id, fn, *args, priority=0):
+        """Queue fn(*args) under task_id; returns its 1-based queue position"""
+        with self._cond:
+            if len(self._queued) >= self.max_queued:
+                raise QueueFull(f"{len(self._queued)} tasks already waiting")
+            self._queued[task_id] = (fn, args)
+            heapq.heappush(self._heap, (priority, next(self._seq), task_id))
+            self._start_workers()
+            self._cond.notify()
+            return self._position(task_id)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    # Skip heap entries whose task was cancelled while waiting
+                    while self._heap and self._heap[0][2] not in self._queued:
+                        heapq.heappop(self._heap)
+                    if self._heap:
+                        break
+                    self._cond.wait()
+                task_id = heapq.heappop(self._heap)[2]
+                fn, args = self._queued.pop(task_id)
+                cancel_event = threading.Event()
+                self._running[task_id] = cancel_event
+            try:
+                fn(*args, cancel_event=cancel_event)
+            except Exception:
+                logging.exception("Task %s failed", task_id)
+            finally:
+                with self._cond:
+                    self._running.pop(task_id, None)
+
+    def _position(self, task_id):
+        if task_id not in self._queued:
+            return None
+        waiting = sorted(entry for entry in self._heap if entry[2] in self._queued)
+        return 1 + [entry[2] for entry in waiting].index(task_id)
+
+    def position(self, task_id):
+        """1-based position of a waiting task, or None once it has started (or is unknown)"""
+        with self._cond:
+            return self._position(task_id)
+
+    def task_ids(self):
+        """Ids of the tasks waiting or running in this queue"""
+        with self._cond:
+            return [*self._queued, *self._running]
+
+    def active(self, task_id):
+        """True while task_id is waiting or running in this queue"""
+        with self._cond:
+            return task_id in self._queued or task_id in self._running
+
+    def cancel(self, task_id):
+        """Cancel a task: 'queued' if it was removed before starting, 'running' if asked to stop, else None"""
+        with self._cond:
+            if self._queued.pop(task_id, None) is not None:
+                return 'queued'
+            cancel_event = self._running.get(task_id)
+            if cancel_event is not None:
+                cancel_event.set()
+                return 'running'
+            return None
+
+    def stats(self):
+        """Counts of waiting and running tasks and the worker limit"""
+        with self._cond:
+            return {'queued': len(self._queued), 'running': len(self._running), 'workers': self.workers}
@@ -0,0 +1,229 @@
+import json
+import sqlite3
+import threading
+import time
+
+# Finished (and abandoned) tasks are kept this long after their last update
+DEFAULT_TASK_TTL = 7 * 24 * 60 * 60
+# Eviction runs at most this often, piggybacking on writes
+EVICT_INTERVAL = 10 * 60
+# Minimum seconds between store writes of a running task's counter-only updates
+WRITE_THROUGH_INTERVAL = 0.5
+# Waiting and running tasks are touched this often by the process that owns them;
+# an unfinished task untouched for TASK_LOST_AFTER seconds has lost its worker
+HEARTBEAT_INTERVAL = 30
+TASK_LOST_AFTER = 3 * HEARTBEAT_INTERVAL
+# A running task looks for cancel requests from other processes at most this often
+CANCEL_POLL_INTERVAL = 1.0
+
+
+class TaskStore:
+    """SQLite-backed progress snapshots and results of scraping tasks.
+
+    Shared by every web worker process that opens the same file, so a progress
+    page can be served by a different worker than the one running the task.
+    Tasks not updated for ``ttl`` seconds are evicted.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TASK_TTL):
+        self.path = str(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Progress is transient; WAL + NORMAL stays consistent but skips an fsync per update
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                completed INTEGER NOT NULL DEFAULT 0,
+                progress TEXT NOT NULL,
+                result TEXT,
+                cancel_requested INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        # Stores created before cancel requests were shared
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(tasks)")}
+        if 'cancel_requested' not in columns:
+            try:
+                self._db.execute("ALTER TABLE tasks ADD COLUMN cancel_requested INTEGER NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass  # another process added it first
+        self._db.execute("CREATE INDEX IF NOT EXISTS tasks_updated_at ON tasks (updated_at)")
+        self._db.commit()
+        self._last_evict = 0.0
+        self.evict()
+
+    def put_progress(self, task_id, snapshot, result=None):
+        """Create or replace a task's progress snapshot, storing its result in the same write"""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                """
+                INSERT INTO tasks (task_id, created_at, updated_at, completed, progress, result)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    updated_at = excluded.updated_at, completed = excluded.completed,
+                    progress = excluded.progress, result = COALESCE(excluded.result, tasks.result)
+                """,
+                (
+                    task_id, now, now, int(bool(snapshot.get('completed'))), json.dumps(snapshot),
+                    json.dumps(result) if result is not None else None,
+                ),
+            )
+            self._db.commit()
+        if now - self._last_evict > EVICT_INTERVAL:
+            self.evict()
+
+    def get_progress(self, task_id):
+        """Latest progress snapshot, or None for an unknown (or evicted) task"""
+        with self._lock:
+            row = self._db.execute("SELECT progress FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def updated_at(self, task_id):
+        """time.time() of the task's last write or heartbeat, or None for an unknown task"""
+        with self._lock:
+            row = self._db.execute("SELECT updated_at FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def touch(self, task_ids):
+        """Heartbeat: mark unfinished tasks as updated now"""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+        with self._lock:
+            self._db.execute(
+                f"UPDATE tasks SET updated_at = ? WHERE completed = 0 AND task_id IN ({','.join('?' * len(task_ids))})",
+                (time.time(), *task_ids),
+            )
+            self._db.commit()
+
+    def request_cancel(self, task_id):
+        """Flag an unfinished task for cancellation by whichever process runs it; False if none"""
+        with self._lock:
+            flagged = self._db.execute(
+                "UPDATE tasks SET cancel_requested = 1 WHERE task_id = ? AND completed = 0", (task_id,)
+            ).rowcount
+            self._db.commit()
+        return bool(flagged)
+
+    def cancel_requested(self, task_id):
+        with self._lock:
+            row = self._db.execute("SELECT cancel_requested FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return bool(row and row[0])
+
+    def get_result(self, task_id):
+        """Stored result, or None"""
+        with self._lock:
+            row = self._db.execute("SELECT result FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    def delete(self, task_id):
+        """Forget a task"""
+        with self._lock:
+            self._db.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+            self._db.commit()
+
+    def evict(self, now=None):
+        """Delete tasks not updated within the TTL; returns how many were removed"""
+        now = now or time.time()
+        with self._lock:
+            self._last_evict = now
+            removed = self._db.execute("DELETE FROM tasks WHERE updated_at < ?", (now - self.ttl,)).rowcount
+            self._db.commit()
+        return removed
+
+    def stats(self):
+        """Task counts by state"""
+        with self._lock:
+            total, completed = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(completed), 0) FROM tasks"
+            ).fetchone()
+        return {'tasks': total, 'completed': completed, 'active': total - completed}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class StoreCancelEvent:
+    """A task's cancel event that a cancel request in the TaskStore also sets.
+
+    Wraps the threading.Event the task queue hands the task. is_set() checks the
+    store, at most every ``interval`` seconds, so a cancel sent to any worker
+    process reaches the one running the task.
+    """
+
+    def __init__(self, store, task_id, event=None, interval=CANCEL_POLL_INTERVAL):
+        self.store = store
+        self.task_id = task_id
+        self.event = event if event is not None else threading.Event()
+        self.interval = interval
+        self._checked_at = None
+
+    def set(self):
+        self.event.set()
+
+    def is_set(self):
+        if self.event.is_set():
+            return True
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.interval:
+            self._checked_at = now
+            if self.store.cancel_requested(self.task_id):
+                self.event.set()
+        return self.event.is_set()
+
+
+class ProgressRegistry:
+    """Progress snapshots of the tasks running in this process, in front of a TaskStore.
+
+    A published snapshot is never mutated: each update swaps in a new dict, so
+    get() reads without taking a lock and always sees a complete snapshot.
+    Writers are serialized per task by the caller (ProgressTracker's lock).
+    Finished tasks leave the registry once their final snapshot is stored, so
+    only running tasks are held in memory; other tasks are read from the store.
+
+    Status changes are written through to the store at once; updates that only
+    move counters are written at most every ``write_interval`` seconds, which
+    is how stale other worker processes may see them.
+    """
+
+    def __init__(self, store, write_interval=WRITE_THROUGH_INTERVAL):
+        self.store = store
+        self.write_interval = write_interval
+        self._snapshots = {}
+        self._written = {}   # task_id -> (monotonic time, status) of the last store write
+
+    def publish(self, task_id, snapshot, result=None):
+        """Record a new snapshot for task_id, writing it through to the store"""
+        if snapshot.get('completed'):
+            self.store.put_progress(task_id, snapshot, result)
+            self._snapshots.pop(task_id, None)
+            self._written.pop(task_id, None)
+            return
+        self._snapshots[task_id] = snapshot
+        now = time.monotonic()
+        written_at, status = self._written.get(task_id, (None, None))
+        if written_at is None or status != snapshot.get('status') or now - written_at >= self.write_interval:
+            self._written[task_id] = (now, snapshot.get('status'))
+            self.store.put_progress(task_id, snapshot, result)
+
+    def get(self, task_id):
+        """Latest snapshot (treat as read-only), or None for an unknown task"""
+        snapshot = self._snapshots.get(task_id)
+        if snapshot is not None:
+            return snapshot
+        return self.store.get_progress(task_id)
+
+    def discard(self, task_id):
+        """Forget a task entirely"""
+        self._snapshots.pop(task_id, None)
+        self._written.pop(task_id, None)
+        self.store.delete(task_id)
+
+    def __len__(self):
+        return len(self._snapshots)
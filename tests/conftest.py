@@ -0,0 +1,49 @@
+"""Shared fixtures: the app with its stores in a temp dir, and the offline Legistar stand-in."""
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "benchmarks"))
+sys.path.insert(0, str(ROOT))
+
+# app.py opens its stores at import; keep them out of the working tree
+_STORE_DIR = tempfile.mkdtemp(prefix="scraper-tests-")
+os.environ.setdefault("SCRAPER_TASK_DB", os.path.join(_STORE_DIR, "tasks.sqlite3"))
+os.environ.setdefault("SCRAPER_SEARCH_DB", os.path.join(_STORE_DIR, "search_index.sqlite3"))
+os.environ.setdefault("SCRAPER_TEXT_CACHE_DIR", os.path.join(_STORE_DIR, "pdf_text_cache"))
+os.environ.setdefault("SCRAPER_CACHE_DIR", os.path.join(_STORE_DIR, "http_cache"))
+os.environ.setdefault("SCRAPER_LOG_LEVEL", "WARNING")
+
+
+@pytest.fixture(scope="session")
+def webapp():
+    import app
+    app.app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture
+def client(webapp):
+    return webapp.app.test_client()
+
+
+@pytest.fixture
+def standin():
+    from legistar_standin import LegistarStandIn
+    with LegistarStandIn(items=3, attachments=2, packet_pages=40) as server:
+        yield server
+
+
+@pytest.fixture
+def scraper(standin):
+    from scraper_module import ScraperInterface
+    logging.getLogger().setLevel(logging.WARNING)
+    with ScraperInterface(rate=0) as instance:
+        instance.BASE_URL = standin.base_url
+        instance.DEPARTMENT_PAGE = standin.body_url()
+        yield instance
@@ -0,0 +1,43 @@
+from urllib.parse import quote
+
+
+def test_zip_download_of_non_latin1_folder(client, tmp_path):
+    folder = tmp_path / "Item3 - 会议"
+    folder.mkdir()
+    (folder / "agenda.txt").write_text("agenda", encoding="utf-8")
+
+    response = client.get('/download_folder_zip', query_string={'path': str(folder)})
+
+    assert response.status_code == 200
+    disposition = response.headers['Content-Disposition']
+    assert disposition.startswith('attachment')
+    assert "filename*=UTF-8''" + quote("Item3 - 会议") in disposition
+    assert response.data[:2] == b"PK"
+
+
+def test_zip_download_name_with_quote(client, tmp_path):
+    folder = tmp_path / 'Item "4"'
+    folder.mkdir()
+    (folder / "a.txt").write_text("a", encoding="utf-8")
+
+    response = client.get('/download_folder_zip', query_string={'path': str(folder)})
+
+    assert response.status_code == 200
+    assert 'filename="Item \\"4\\"_' in response.headers['Content-Disposition']
+
+
+def test_progress_stream_ends_so_the_browser_reconnects(webapp, client, monkeypatch):
+    monkeypatch.setattr(webapp, 'SSE_STREAM_SECONDS', 1)
+    webapp.TASK_STORE.put_progress('sse-live', {'progress': 5, 'status': 'Working', 'completed': False})
+
+    body = client.get('/api/progress/sse-live/stream').get_data(as_text=True)
+
+    events = body.split("\n\n")
+    assert events[0] == f"retry: {webapp.SSE_RETRY_MS}"
+    assert events[1].startswith('data: ') and '"Working"' in events[1]
+
+
+def test_progress_stream_of_unknown_task_ends_at_once(client):
+    body = client.get('/api/progress/no-such-task/stream').get_data(as_text=True)
+
+    assert '"completed": true' in body
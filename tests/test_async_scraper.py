@@ -0,0 +1,55 @@
+import asyncio
+import contextlib
+import io
+
+from async_scraper import AsyncScraperInterface
+from legistar_standin import YEAR
+
+
+def run_async(standin, call, **kwargs):
+    async def main():
+        async with AsyncScraperInterface(rate=0, **kwargs) as scraper:
+            scraper.BASE_URL = standin.base_url
+            scraper.DEPARTMENT_PAGE = standin.body_url()
+            return await call(scraper)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(main())
+
+
+def test_meeting_results_have_the_sync_keys(scraper, standin, tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        sync = scraper.process_meeting(standin.meeting_url(), tmp_path / "sync", {})
+    result = run_async(standin, lambda s: s.process_meeting_async(standin.meeting_url(), tmp_path / "async", {}))
+
+    assert result.keys() == sync.keys()
+    assert result['timings'].keys() >= {'phases', 'wall_seconds'}
+    assert result['processed_items'] == sync['processed_items']
+    assert result['extra_files'] == sync['extra_files']
+
+
+def test_date_range_results_have_the_sync_keys(scraper, standin, tmp_path):
+    start, end = f"01/01/{YEAR}", f"01/31/{YEAR}"
+    params = {'split_supplemental': False}
+    with contextlib.redirect_stdout(io.StringIO()):
+        meetings = scraper.fetch_meetings_for_date_range(start, end)
+        sync = scraper.process_meetings(meetings, tmp_path / "sync", params)
+    results = run_async(standin, lambda s: s.process_date_range_async(start, end, tmp_path / "async", params))
+
+    assert [r.keys() for r in results] == [r.keys() for r in sync]
+    assert [(r['date'], r['time'], r['url']) for r in results] == [(r['date'], r['time'], r['url']) for r in sync]
+
+
+def test_resync_reuses_the_manifest_and_http_cache(standin, tmp_path):
+    dest = tmp_path / "meeting"
+    cache_dir = tmp_path / "cache"
+    run_async(standin, lambda s: s.process_meeting_async(standin.meeting_url(), dest, {}), cache_dir=cache_dir)
+    standin.reset_counters()
+
+    result = run_async(
+        standin, lambda s: s.process_meeting_async(standin.meeting_url(), dest, {'resync': True}), cache_dir=cache_dir,
+    )
+
+    assert (result['items_fetched'], result['items_unchanged']) == (0, 3)
+    # Only the meeting and item pages are revalidated; no attachment is requested again
+    assert standin.counters()['requests'] == 1 + 3
+    assert result['timings']['cache_revalidated'] == 1 + 3
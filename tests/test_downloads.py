@@ -0,0 +1,76 @@
+import contextlib
+import io
+
+
+def process(scraper, standin, dest, params=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scraper.process_meeting(standin.meeting_url(), dest, dict({'max_workers': 1}, **(params or {})))
+
+
+def test_rescrape_of_existing_tree_reuses_connections(scraper, standin, tmp_path):
+    process(scraper, standin, tmp_path / "meeting")
+    first = scraper.connection_stats()
+    standin.reset_counters()
+
+    process(scraper, standin, tmp_path / "meeting")
+    second = scraper.connection_stats()
+    served = standin.counters()
+
+    # Existing attachments are checked with HEAD: no body is left unread, so every
+    # request of the second pass goes over the keep-alive connection of the first
+    requests_made = second['requests'] - first['requests']
+    assert requests_made == served['requests'] > 5
+    assert second['connections_reused'] - first['connections_reused'] == requests_made
+    assert served['connections'] == 0
+    assert served['bytes'] < len(standin.attachment_pdf)
+
+
+def test_first_scrape_sends_no_head_requests(scraper, standin, tmp_path):
+    process(scraper, standin, tmp_path / "meeting")
+
+    # One GET per page and file: 1 meeting, 3 items, 2 extras, 3 x 2 attachments
+    assert standin.counters()['requests'] == 1 + 3 + 2 + 6
+
+
+def test_resync_sees_attachments_added_since_the_last_run(standin, tmp_path):
+    from scraper_module import ScraperInterface
+    dest = tmp_path / "meeting"
+    # With the HTTP cache on, the meeting and item pages of the first run are still fresh
+    with ScraperInterface(rate=0, cache_dir=tmp_path / "cache") as scraper:
+        scraper.BASE_URL = standin.base_url
+        first = process(scraper, standin, dest)
+        assert all(len(item['files']) == 2 for item in first['processed_items'])
+
+        standin.attachments = 3
+        resync = process(scraper, standin, dest, {'resync': True})
+
+    assert resync['items_fetched'] == 3
+    assert all(len(item['files']) == 3 for item in resync['processed_items'])
+
+
+def test_resync_reuses_items_whose_attachments_are_unchanged(scraper, standin, tmp_path):
+    process(scraper, standin, tmp_path / "meeting")
+    standin.reset_counters()
+
+    resync = process(scraper, standin, tmp_path / "meeting", {'resync': True})
+
+    assert (resync['items_fetched'], resync['items_unchanged']) == (0, 3)
+    # The meeting page and each item page, nothing else
+    assert standin.counters()['requests'] == 1 + 3
+
+
+def test_attachments_named_alike_get_separate_files(scraper, standin, tmp_path):
+    standin.attachment_name = "Staff Report.pdf"
+    dest = tmp_path / "meeting"
+    first = process(scraper, standin, dest, {'max_workers': 4})
+    names = [item['files'] for item in first['processed_items']]
+    assert names == [["Staff Report.pdf", "Staff Report (2).pdf"]] * 3
+    for item in first['processed_items']:
+        folder = next(dest.glob(f"Item{item['index']} - *"))
+        assert sorted(p.name for p in folder.glob("*.pdf")) == sorted(item['files'])
+
+    # A re-scrape maps each URL to the same file and downloads nothing
+    standin.reset_counters()
+    again = process(scraper, standin, dest, {'max_workers': 4})
+    assert [item['files'] for item in again['processed_items']] == names
+    assert standin.counters()['bytes'] < len(standin.attachment_pdf)
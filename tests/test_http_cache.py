@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from http_cache import HTTPCache, PAST_MEETING_TTL
+from scraper_module import ScraperInterface
+
+MEETING_URL = "https://example.legistar.com/MeetingDetail.aspx?ID=1&GUID=M"
+
+
+def ttl_of(cache, url):
+    return cache._db.execute("SELECT ttl FROM entries WHERE url = ?", (url,)).fetchone()[0]
+
+
+@pytest.mark.parametrize("days_ago, pinned", [(0, False), (5, False), (13, False), (20, True)])
+def test_past_meeting_ttl_starts_after_grace_period(tmp_path, days_ago, pinned):
+    with ScraperInterface(rate=0, cache_dir=tmp_path) as scraper:
+        cache = scraper.transport.cache
+        cache.store(MEETING_URL, {}, b"<html></html>", "utf-8")
+        normal = ttl_of(cache, MEETING_URL)
+        meeting_dt = (datetime.now() - timedelta(days=days_ago)).strftime('%m/%d/%Y') + " 6:00 PM"
+
+        scraper.extend_past_meeting_ttl(MEETING_URL, meeting_dt)
+
+        assert ttl_of(cache, MEETING_URL) == (PAST_MEETING_TTL if pinned else normal)
+
+
+def test_headers_only_entries_are_capped(tmp_path):
+    cache = HTTPCache(tmp_path, max_header_entries=3)
+    for i in range(5):
+        cache.store(f"https://example.com/View.ashx?ID={i}", {"ETag": str(i)})
+
+    assert cache.stats()['entries'] == 3
+    cache.close()
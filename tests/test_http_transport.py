@@ -0,0 +1,32 @@
+from http_transport import HTTPTransport, RateLimiter
+
+
+def test_head_reports_get_headers_over_the_pooled_connection(standin):
+    url = f"{standin.base_url}View.ashx?M=F&ID=11&GUID=F"
+    transport = HTTPTransport(rate=0)
+    try:
+        head = transport.head(url)
+        get = transport.get(url)
+    finally:
+        transport.close()
+
+    assert head.status_code == 200
+    assert head.content == b""
+    assert int(head.headers['Content-Length']) == len(get.content)
+    assert head.headers['Content-Disposition'] == get.headers['Content-Disposition']
+    assert transport.requests_sent == 2
+    assert standin.counters()['connections'] == 1
+
+
+def test_rate_limit_is_opt_in_but_pauses_always_apply():
+    limiter = RateLimiter()
+    assert all(limiter.reserve("host") <= 0 for _ in range(100))
+    limiter.pause("host", 5)
+    assert 4 < limiter.reserve("host") <= 5
+    assert limiter.reserve("other") <= 0
+
+
+def test_burst_covers_every_worker_before_throttling():
+    limiter = RateLimiter(rate=1, burst=16)
+    assert all(limiter.reserve("host") <= 0 for _ in range(16))
+    assert limiter.reserve("host") > 0
@@ -0,0 +1,43 @@
+import logging
+import logging.handlers
+import queue
+import threading
+
+from log_setup import DeferredQueueHandler
+
+
+def record(msg, args):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def test_immutable_args_are_left_for_the_listener():
+    records = queue.SimpleQueue()
+    DeferredQueueHandler(records).emit(record("%s of %d", ("page", 3)))
+    queued = records.get_nowait()
+    assert queued.msg == "%s of %d" and queued.args == ("page", 3)
+    assert queued.getMessage() == "page of 3"
+
+
+def test_mutable_args_are_merged_before_they_can_change():
+    records = queue.SimpleQueue()
+    items = ["a"]
+    DeferredQueueHandler(records).emit(record("items %s", (items,)))
+    items.append("b")
+    queued = records.get_nowait()
+    assert queued.args is None
+    assert queued.getMessage() == "items ['a']"
+
+
+def test_formatting_happens_on_the_listener_thread():
+    records = queue.SimpleQueue()
+    out = []
+    sink = logging.Handler()
+    sink.emit = lambda r: out.append((threading.current_thread().name, r.getMessage()))
+    listener = logging.handlers.QueueListener(records, sink)
+    listener.start()
+    try:
+        DeferredQueueHandler(records).emit(record("%s", ("plain",)))
+    finally:
+        listener.stop()
+    [(thread, message)] = out
+    assert message == "plain" and thread != threading.current_thread().name
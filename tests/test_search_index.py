@@ -0,0 +1,24 @@
+from meeting_manifest import MANIFEST_NAME
+from search_index import SearchIndex
+
+
+def write_meeting(folder, text):
+    (folder / "Item1 - Budget").mkdir(parents=True)
+    (folder / "AgendaHeader.md").write_text(f"# {text}", encoding="utf-8")
+    (folder / "Item1 - Budget" / "AgendaHeader.md").write_text(f"{text} budget item", encoding="utf-8")
+    (folder / MANIFEST_NAME).write_text("{}", encoding="utf-8")
+
+
+def test_meeting_in_an_archive_root_skips_the_meetings_below_it(tmp_path):
+    root = tmp_path / "OUT_MEETING_FOLDER"
+    write_meeting(root / "2025-01-03 1800 ID103", "January")
+    index = SearchIndex(tmp_path / "index.sqlite3")
+    try:
+        assert index.index_folder(root / "2025-01-03 1800 ID103")['indexed'] == 2
+        # A single meeting scraped straight into the root walks only its own files
+        write_meeting(root, "Special")
+        assert index.index_folder(root) == {'indexed': 2, 'unchanged': 0, 'removed': 0, 'failed': 0}
+        assert index.index_folder(root)['unchanged'] == 2
+        assert {hit['folder'] for hit in index.search("budget")} == {str(root), str(root / "2025-01-03 1800 ID103")}
+    finally:
+        index.close()
@@ -0,0 +1,65 @@
+import io
+import logging
+import os
+import zipfile
+from pathlib import Path
+
+# Formats that are already compressed; deflating them again costs CPU and saves nothing
+STORED_SUFFIXES = {
+    '.pdf', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.tif', '.tiff',
+    '.zip', '.gz', '.7z', '.docx', '.xlsx', '.pptx', '.mp3', '.mp4', '.m4a', '.mov',
+}
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Unseekable sink for ZipFile; take() hands over whatever was written since the last call"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(folder, chunk_size=1024 * 1024):
+    """Yield a zip archive of folder piece by piece, never holding more than about one chunk.
+
+    Entries are named relative to folder's parent (so the archive unpacks into
+    a folder of the same name). Files in STORED_SUFFIXES are stored as-is,
+    everything else is deflated. Files that vanish mid-walk are skipped.
+    """
+    folder = Path(folder)
+    sink = _ChunkBuffer()
+    # ZipFile sees an unseekable stream and writes sizes in data descriptors after each entry
+    with zipfile.ZipFile(sink, 'w', allowZip64=True) as zf:
+        for root, dirs, files in os.walk(folder):
+            dirs.sort()
+            for name in sorted(files):
+                path = Path(root) / name
+                try:
+                    zinfo = zipfile.ZipInfo.from_file(path, path.relative_to(folder.parent))
+                    zinfo.compress_type = (
+                        zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+                    )
+                    with open(path, 'rb') as src, zf.open(zinfo, 'w') as dst:
+                        for chunk in iter(lambda: src.read(chunk_size), b""):
+                            dst.write(chunk)
+                            data = sink.take()
+                            if data:
+                                yield data
+                except FileNotFoundError:
+                    logging.warning("Skipping %s: removed while zipping", path)
+                    continue
+                yield sink.take()
+    # Central directory
+    yield sink.take()